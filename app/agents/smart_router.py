@@ -3,20 +3,26 @@ Smart Agent Router and Team Leader with Local LLM Integration
 Uses FunctionGemma for intelligent agent routing and tool calling.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from enum import Enum
 import json
 import asyncio
 
-from agno.agent import Agent
-from agno.tools import Toolkit
-
-from app.models.local_llm import LocalLlamaModel, model_manager
-from app.config import config
+from app.config import ONLINE_PRIVACY_MODES, config
 from app.logger import get_logger
 
+# Agno and the local model stack are imported where they are used so that
+# importing the router (and app.core with it) stays cheap.
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = get_logger("migru.router")
 
+# Moods that tip a message towards emotional support
+_DISTRESSED_MOODS = frozenset({"anxious", "depressed", "overwhelmed"})
+
 
 class TaskType(Enum):
     """Task types for intelligent routing."""
@@ -43,6 +49,8 @@ class SmartRouter:
     async def initialize(self):
         """Initialize the router with local FunctionGemma model."""
         try:
+            from app.models.local_llm import LocalLlamaModel
+
             # Create router model with tool calling capabilities
             self.router_model = LocalLlamaModel(
                 model="function-gemma:7b",
@@ -165,7 +173,7 @@ class SmartRouter:
         # Consider context
         if context:
             user_mood = context.get("user_mood", "")
-            if user_mood in ["anxious", "depressed", "overwhelmed"]:
+            if user_mood in _DISTRESSED_MOODS:
                 emotional_score += 2
 
         # Determine task type based on scores
@@ -195,6 +203,8 @@ class SmartRouter:
         Returns:
             Tuple of (selected_agent, routing_reason)
         """
+        from app.models.local_llm import model_manager
+
         task_type = self.analyze_task(message, context)
 
         # Get optimal model for this task
@@ -228,6 +238,9 @@ class SmartRouter:
 
     async def _create_agent(self, task_type: TaskType, model_name: str) -> Agent:
         """Create an agent optimized for the specific task type."""
+        from agno.agent import Agent
+
+        from app.models.local_llm import model_manager
 
         # Get optimized model for this task
         model = model_manager.create_model_for_task(task_type.value)
@@ -369,10 +382,10 @@ class SmartRouter:
 
         tools = []
 
-        if task_type in [TaskType.RESEARCH, TaskType.TOOL_EXECUTION]:
+        if task_type in (TaskType.RESEARCH, TaskType.TOOL_EXECUTION):
             # Add search tools for research and tool execution
             if (
-                config.PRIVACY_MODE in ["hybrid", "flexible"]
+                config.PRIVACY_MODE in ONLINE_PRIVACY_MODES
                 or config.ENABLE_SEARCH_IN_LOCAL_MODE
             ):
                 tools.append(SmartSearchTools())
@@ -389,6 +402,8 @@ class SmartRouter:
         if not self.task_history:
             return {"total_routes": 0}
 
+        from app.models.local_llm import model_manager
+
         # Count task types
         task_counts = {}
         model_counts = {}
@@ -5,9 +5,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import (
+    CompleteEvent,
     Completer,
     Completion,
-    NestedCompleter,
     WordCompleter,
 )
 from prompt_toolkit.document import Document
@@ -32,6 +32,50 @@ class CommandValidator(Validator):
                     cursor_position=len(text)
                 )
 
+class PrefixCompleter(Completer):
+    """
+    Completes "/command [argument]" from prefix tables built once.
+
+    Every prefix of every command, and of each command's arguments, maps
+    straight to its ready-made completions, so a keystroke costs one dict
+    lookup instead of a scan over every word. Matching ignores case.
+    """
+
+    def __init__(self, structure: Dict[str, Optional[Dict[str, Any]]]):
+        self._commands = self._prefix_table(structure)
+        self._arguments = {
+            command: self._prefix_table(arguments)
+            for command, arguments in structure.items()
+            if arguments
+        }
+
+    @staticmethod
+    def _prefix_table(words: Any) -> Dict[str, Tuple[Completion, ...]]:
+        table: Dict[str, List[Completion]] = {}
+        for word in words:
+            for end in range(len(word) + 1):
+                table.setdefault(word[:end].lower(), []).append(
+                    Completion(word, start_position=-end)
+                )
+        return {prefix: tuple(completions) for prefix, completions in table.items()}
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent):
+        # Runs on every keystroke; plain chat text bails out before any work
+        text = document.text_before_cursor
+        if not text or text[0] != "/":
+            return
+
+        command, sep, argument = text.partition(" ")
+        if not sep:
+            yield from self._commands.get(command.lower(), ())
+            return
+
+        arguments = self._arguments.get(command.lower())
+        argument = argument.lstrip()
+        if arguments is not None and " " not in argument:
+            yield from arguments.get(argument.lower(), ())
+
+
 class IntelligentCommandPalette:
     """Command palette with intelligent suggestions and nested completion."""
 
@@ -66,8 +110,8 @@ class IntelligentCommandPalette:
         self.valid_commands = list(self.command_structure.keys())
 
     def get_completer(self) -> Completer:
-        """Get the nested completer."""
-        return NestedCompleter.from_nested_dict(self.command_structure)
+        """Get the command/argument completer."""
+        return PrefixCompleter(self.command_structure)
 
     def get_validator(self) -> Validator:
         """Get the command validator."""
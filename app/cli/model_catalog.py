@@ -0,0 +1,190 @@
+"""
+Stale-while-revalidate catalog behind the /model command.
+
+The catalog is always served from disk. Its entries come from the read-only
+seed shipped in app/cache/models.json, so models added in a release show up
+at once. Availability and fetch time come from the user's cached copy
+(~/.cache/migru/models.json) when there is one. Once the catalog is older than
+CATALOG_TTL, callers schedule refresh_catalog() in the background. The refresh
+asks each provider which models it currently serves and atomically rewrites
+the user's copy. It never runs in local privacy mode, and a failed refresh
+leaves the stale catalog in place.
+"""
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from app.config import ONLINE_PRIVACY_MODES, config
+from app.logger import get_logger
+
+logger = get_logger("migru.cli.model_catalog")
+
+# Packaged seed data; never written to
+SEED_CATALOG_PATH = Path(__file__).resolve().parent.parent / "cache" / "models.json"
+# Refreshed copies go to the user's cache directory
+CATALOG_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "migru" / "models.json"
+)
+CATALOG_TTL = 24 * 60 * 60  # seconds
+
+# provider prefix (as in config model ids) -> (model list endpoint, API key env var)
+_PROVIDER_ENDPOINTS = {
+    "mistral": ("https://api.mistral.ai/v1/models", "MISTRAL_API_KEY"),
+    "cerebras": ("https://api.cerebras.ai/v1/models", "CEREBRAS_API_KEY"),
+    "openai": ("https://api.openai.com/v1/models", "OPENAI_API_KEY"),
+}
+
+# (name, provider, speed, intelligence, available); available is None until checked
+CatalogEntry = tuple[str, str, str, str, Optional[bool]]
+
+
+@lru_cache(maxsize=2)
+def _read_catalog(path: Path, mtime_ns: int) -> tuple[float, tuple[CatalogEntry, ...]]:
+    """Parse a catalog file; keyed on its mtime so rewrites are picked up."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    entries = tuple(
+        (e["name"], e["provider"], e["speed"], e["intelligence"], e.get("available"))
+        for e in data.get("entries", [])
+    )
+    return float(data.get("fetched_at", 0)), entries
+
+
+def _try_read(path: Path) -> Optional[tuple[float, tuple[CatalogEntry, ...]]]:
+    try:
+        return _read_catalog(path, path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug("Model catalog %s unreadable: %s", path, e)
+        return None
+
+
+def load_catalog() -> tuple[float, tuple[CatalogEntry, ...]]:
+    """Return (fetched_at, entries) from the on-disk catalog without blocking on the network."""
+    seed = _try_read(SEED_CATALOG_PATH)
+    cached = _try_read(CATALOG_PATH)
+    if cached is None:
+        return seed or (0.0, ())
+    if seed is None:
+        return cached
+
+    # Seed entries, with the availability last seen for each
+    fetched_at, cached_entries = cached
+    available = {entry[0]: entry[4] for entry in cached_entries}
+    return fetched_at, tuple(
+        (name, provider, speed, intelligence, available.get(name, seed_available))
+        for name, provider, speed, intelligence, seed_available in seed[1]
+    )
+
+
+def refresh_allowed() -> bool:
+    """Whether the privacy mode permits asking providers for their model lists."""
+    return config.PRIVACY_MODE in ONLINE_PRIVACY_MODES
+
+
+def is_stale(fetched_at: float) -> bool:
+    """Whether a catalog fetched at ``fetched_at`` should be revalidated."""
+    return time.time() - fetched_at > CATALOG_TTL
+
+
+async def _fetch_provider_models(
+    client: httpx.AsyncClient, url: str, api_key: str
+) -> set[str]:
+    response = await client.get(url, headers={"Authorization": f"Bearer {api_key}"})
+    response.raise_for_status()
+    return {model["id"] for model in response.json().get("data", [])}
+
+
+async def _fetch_served_models() -> dict[str, set[str]]:
+    """Model ids served by every provider we hold a key for."""
+    providers = [
+        (prefix, url, os.environ[key_var])
+        for prefix, (url, key_var) in _PROVIDER_ENDPOINTS.items()
+        if os.environ.get(key_var)
+    ]
+    if not providers:
+        return {}
+
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        results = await asyncio.gather(
+            *[_fetch_provider_models(client, url, key) for _, url, key in providers],
+            return_exceptions=True,
+        )
+
+    served = {}
+    for (prefix, _, _), result in zip(providers, results):
+        if isinstance(result, BaseException):
+            logger.debug("Model list for %s failed: %s", prefix, result)
+        else:
+            served[prefix] = result
+    return served
+
+
+def _write_catalog(fetched_at: float, entries: list[CatalogEntry]) -> None:
+    """Atomically replace the user's catalog copy."""
+    payload = {
+        "fetched_at": fetched_at,
+        "entries": [
+            {
+                "name": name,
+                "provider": provider,
+                "speed": speed,
+                "intelligence": intelligence,
+                "available": available,
+            }
+            for name, provider, speed, intelligence, available in entries
+        ],
+    }
+    CATALOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CATALOG_PATH.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, CATALOG_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+async def refresh_catalog(resolve: Callable[[str], Optional[str]]) -> bool:
+    """
+    Revalidate the catalog against the providers' model lists.
+
+    Args:
+        resolve: Maps a catalog name to its "provider:model" id.
+
+    Returns:
+        True if the catalog file was rewritten.
+    """
+    if not refresh_allowed():
+        return False
+
+    _, entries = load_catalog()
+    if not entries:
+        return False
+
+    served = await _fetch_served_models()
+    if not served:
+        return False
+
+    updated = []
+    for name, provider, speed, intelligence, available in entries:
+        prefix, _, model_id = (resolve(name) or "").partition(":")
+        if prefix in served:
+            available = model_id in served[prefix]
+        updated.append((name, provider, speed, intelligence, available))
+
+    try:
+        await asyncio.to_thread(_write_catalog, time.time(), updated)
+    except OSError as e:
+        logger.debug("Could not rewrite model catalog: %s", e)
+        return False
+    return True
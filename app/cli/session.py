@@ -22,8 +22,8 @@ def run_onboarding(user_name: str, console: Console, prompt_session: Any, person
     The new architecture handles onboarding through the TherapeuticCLI.
     """
     try:
-        profile = personalization_engine.get_user_profile(user_name).get_profile()
-        if profile.get("metadata", {}).get("onboarding_completed", False):
+        user_profile = personalization_engine.get_user_profile(user_name)
+        if user_profile.get_profile().get("metadata", {}).get("onboarding_completed", False):
             return
 
         console.print()
@@ -38,11 +38,7 @@ def run_onboarding(user_name: str, console: Console, prompt_session: Any, person
         console.print()
 
         # Mark as complete
-        profile = personalization_engine.get_user_profile(user_name).get_profile()
-        if "metadata" not in profile:
-            profile["metadata"] = {}
-        profile["metadata"]["onboarding_completed"] = True
-        personalization_engine.get_user_profile(user_name).update_profile(profile)
+        user_profile.update_profile({"metadata": {"onboarding_completed": True}})
 
     except Exception as e:
         logger.error(f"Onboarding failed: {e}")
@@ -13,6 +13,9 @@ from app.ui.theme import Themes, UITheme
 
 load_dotenv()
 
+# Privacy modes that may reach the web
+ONLINE_PRIVACY_MODES = frozenset({"hybrid", "flexible"})
+
 
 class Config:
     """Enhanced configuration with local LLM and privacy support."""
@@ -24,6 +27,12 @@ class Config:
     CEREBRAS_API_KEY = os.getenv("CEREBRAS_API_KEY")
     OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+    # Spawn a local redis-server when none answers. Off by default when Redis
+    # is managed externally (sidecar/cloud), where a local start can't work.
+    REDIS_AUTOSTART = (
+        os.getenv("REDIS_AUTOSTART", "false" if os.getenv("REDIS_MANAGED") else "true").lower()
+        == "true"
+    )
 
     # Privacy and Local Model Configuration
     LOCAL_LLM_ENABLED = os.getenv("LOCAL_LLM_ENABLED", "true").lower() == "true"
@@ -77,7 +86,18 @@ class Config:
 
     # Performance Settings
     STREAMING = True
+    # Render streamed replies as Markdown paragraph by paragraph (False streams raw text)
+    STREAM_MARKDOWN = os.getenv("STREAM_MARKDOWN", "true").lower() == "true"
     USE_TEAM = False
+    # Cache replies in Redis for prompts repeated within a session (streamed ones
+    # once fully shown). Cached replies aren't added to the agent's history.
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))  # seconds
+    # Reuse replies for paraphrased prompts (needs the `semantic` extra and Redis Stack)
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    # Detect moods with one Aho-Corasick pass (needs the `fast-match` extra)
+    FAST_MOOD_DETECT = os.getenv("FAST_MOOD_DETECT", "false").lower() == "true"
 
     # UI & Accessibility Settings
     ACCESSIBILITY_MODE = False
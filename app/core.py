@@ -3,17 +3,26 @@ Enhanced Migru Core with Local LLM Integration and Smart Routing
 Combines privacy-first local models with intelligent agent routing.
 """
 
-from typing import Any, Dict, Optional, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 from enum import Enum
 from textwrap import dedent
+from collections import Counter, deque
 import asyncio
+import copy
+import functools
+import time
 
-from agno.agent import Agent
-from app.models.local_llm import model_manager, LocalLlamaModel
 from app.agents.smart_router import smart_router, TaskType
-from app.config import config
+from app.config import ONLINE_PRIVACY_MODES, config
 from app.logger import get_logger
 
+# Agno and the local model stack are imported where agents are built so
+# that importing this module stays cheap for offline commands.
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = get_logger("migru.core")
 
 class AgentMode(Enum):
@@ -23,6 +32,26 @@ class AgentMode(Enum):
     ADVISOR = "advisor"  # Practical guidance and micro-actions
     MED_GEMMA = "med_gemma" # Specialized medical insight using Google's HAI-DEF principles
 
+
+# Routing keywords, matched as substrings of the lowercased message
+_MED_KEYWORDS = frozenset({"symptom", "diagnosis", "medical", "doctor", "clinical", "med-gemma", "gemma", "haidef"})
+_RESEARCH_KEYWORDS = frozenset({"research", "find", "search", "study", "evidence", "science", "proven", "weather"})
+_ADVISOR_KEYWORDS = frozenset({"how to", "help me", "guide", "protocol", "routine", "plan", "start", "try", "advice"})
+
+
+@functools.lru_cache(maxsize=512)
+def _route_query_cached(msg: str) -> AgentMode:
+    """Keyword routing for a normalized message, memoized for repeat queries."""
+    if any(k in msg for k in _MED_KEYWORDS):
+        return AgentMode.MED_GEMMA
+    if any(k in msg for k in _RESEARCH_KEYWORDS):
+        return AgentMode.RESEARCHER
+    if any(k in msg for k in _ADVISOR_KEYWORDS):
+        return AgentMode.ADVISOR
+
+    return AgentMode.COMPANION
+
+
 class PrivacyMode:
     """Privacy mode constants."""
 
@@ -44,54 +73,102 @@ class MigruCore:
         self.agents = {}
         self.current_mode = AgentMode.COMPANION
         self.router = smart_router
+        self._recreate_task: Optional[asyncio.Task] = None
+        self._warmup_task: Optional[asyncio.Task] = None
 
-        # Performance metrics
-        self.response_times = []
-        self.error_counts = {}
+        # Performance metrics (bounded window with a running sum for O(1) averages)
+        self.response_times: deque[float] = deque(maxlen=1024)
+        self._rt_sum = 0.0
+        self.error_counts: Counter[str] = Counter()
 
     async def initialize(self):
         """Initialize the core system with local models."""
         try:
             # Scan for available local models
             if self.local_llm_enabled:
+                from app.models.local_llm import model_manager
+
                 await model_manager.scan_available_models()
-                logger.info(f"Found {len(model_manager.available_models)} local models")
+                logger.info("Found %d local models", len(model_manager.available_models))
 
             # Initialize smart router
             await self.router.initialize()
 
             # Create initial agents
-            await self._create_initial_agents()
+            self.agents = await self._create_initial_agents()
+
+            # Prime local model prompt caches in the background
+            if self.local_llm_enabled:
+                self._warmup_task = asyncio.create_task(self._warmup_agents())
 
             logger.info("Migru Core initialized")
 
         except Exception as e:
-            logger.error(f"Core initialization failed: {e}")
+            logger.error("Core initialization failed: %s", e)
             raise
 
-    async def _create_initial_agents(self):
-        """Create initial set of agents for different task types."""
+    async def _warmup_agents(self) -> None:
+        """
+        Run a one-token throwaway prompt through the companion agent.
+
+        Local servers (Ollama, llama.cpp) keep the KV cache for a repeated
+        prompt prefix, so this moves the system-prompt prefill off the
+        user's first message. Only the companion is warmed, since most first
+        messages go there and a single-slot server would evict one agent's
+        prefix for the next.
+        """
+        agent = self.agents.get(AgentMode.COMPANION)
+        model = getattr(agent, "model", None)
+        if not getattr(model, "is_local", False):
+            return
+
+        # Cap generation so the user's first message doesn't queue behind a reply
+        probe_model = copy.copy(model)
+        probe_model.max_tokens = 1
+        try:
+            probe = agent.deep_copy(update={"model": probe_model})
+            await asyncio.to_thread(probe.run, "hi", stream=False)
+        except Exception as e:
+            logger.debug("Agent warmup failed: %s", e)
+
+    async def _create_initial_agents(self) -> Dict[AgentMode, Agent]:
+        """
+        Create initial set of agents for different task types.
+
+        Agents are built into a fresh dict so callers can swap it in
+        atomically instead of mutating ``self.agents`` in place.
+        """
+        agents = {}
 
         # Create companion agent (emotional support)
-        await self._create_companion_agent()
+        agents[AgentMode.COMPANION] = await self._create_companion_agent()
 
-        # Create researcher agent
-        await self._create_researcher_agent()
+        # Create researcher agent (skipped when it would have nothing to use)
+        researcher = await self._create_researcher_agent()
+        if researcher is not None:
+            agents[AgentMode.RESEARCHER] = researcher
 
         # Create advisor agent
-        await self._create_advisor_agent()
+        agents[AgentMode.ADVISOR] = await self._create_advisor_agent()
 
         # Create Med-Gemma agent
         if config.MED_GEMMA_ENABLED:
-            await self._create_med_gemma_agent()
+            med_gemma = await self._create_med_gemma_agent()
+            if med_gemma is not None:
+                agents[AgentMode.MED_GEMMA] = med_gemma
 
-        logger.info(f"Created {len(self.agents)} initial agents")
+        logger.info("Created %d initial agents", len(agents))
+        return agents
 
-    async def _create_companion_agent(self):
+    async def _create_companion_agent(self) -> Agent:
         """Create empathetic companion agent with local model."""
+        from agno.agent import Agent
+
         if self.local_llm_enabled:
-            model_name = model_manager.get_optimal_model("emotional_support")
+            from app.models.local_llm import model_manager
+
             model = model_manager.create_model_for_task("emotional_support")
+            model_name = model.id
         else:
             model_name = "Cloud Model"
             model = config.MODEL_FAST
@@ -108,21 +185,28 @@ class MigruCore:
             num_history_runs=1,  # Minimal for speed
         )
 
-        self.agents[AgentMode.COMPANION] = agent
-        logger.info(f"Created companion agent with {model_name}")
+        logger.info("Created companion agent with %s", model_name)
+        return agent
+
+    async def _create_researcher_agent(self) -> Optional[Agent]:
+        """Create research agent with tool support, or None in tool-less local mode."""
+        from agno.agent import Agent
+
+        # Get tools based on privacy mode
+        tools = await self._get_research_tools()
+        if not tools and self.privacy_mode == PrivacyMode.LOCAL:
+            logger.info("Skipping researcher agent (no tools in local mode)")
+            return None
 
-    async def _create_researcher_agent(self):
-        """Create research agent with tool support."""
         if self.local_llm_enabled:
-            model_name = model_manager.get_optimal_model("research")
+            from app.models.local_llm import model_manager
+
             model = model_manager.create_model_for_task("research")
+            model_name = model.id
         else:
             model_name = "Cloud Model"
             model = config.MODEL_SMART
 
-        # Get tools based on privacy mode
-        tools = await self._get_research_tools()
-
         agent = Agent(
             name="Migru Researcher",
             model=model,
@@ -134,14 +218,18 @@ class MigruCore:
             exponential_backoff=True,
         )
 
-        self.agents[AgentMode.RESEARCHER] = agent
-        logger.info(f"Created researcher agent with {model_name}")
+        logger.info("Created researcher agent with %s", model_name)
+        return agent
 
-    async def _create_advisor_agent(self):
+    async def _create_advisor_agent(self) -> Agent:
         """Create practical advisor agent."""
+        from agno.agent import Agent
+
         if self.local_llm_enabled:
-            model_name = model_manager.get_optimal_model("practical_advice")
+            from app.models.local_llm import model_manager
+
             model = model_manager.create_model_for_task("practical_advice")
+            model_name = model.id
         else:
             model_name = "Cloud Model"
             model = config.MODEL_SMART
@@ -158,17 +246,22 @@ class MigruCore:
             num_history_runs=2,
         )
 
-        self.agents[AgentMode.ADVISOR] = agent
-        logger.info(f"Created advisor agent with {model_name}")
+        logger.info("Created advisor agent with %s", model_name)
+        return agent
 
-    async def _create_med_gemma_agent(self):
-        """Create specialized Med-Gemma agent for medical insights."""
+    async def _create_med_gemma_agent(self) -> Optional[Agent]:
+        """Create specialized Med-Gemma agent, or None if its local model is missing."""
         from agno.agent import Agent
 
         # Use the configured Med-Gemma model (likely Gemma 2)
         if self.local_llm_enabled:
+             from app.models.local_llm import LocalLlamaModel, model_manager
+
+             if config.MED_GEMMA_MODEL not in model_manager.available_models:
+                 logger.info("Skipping Med-Gemma agent (%s not available)", config.MED_GEMMA_MODEL)
+                 return None
+
              # Force use of configured Gemma model for this agent
-             from app.models.local_llm import LocalLlamaModel
              model = LocalLlamaModel(
                  id=config.MED_GEMMA_MODEL,
                  model=config.MED_GEMMA_MODEL,
@@ -190,8 +283,8 @@ class MigruCore:
             num_history_runs=3,
         )
         
-        self.agents[AgentMode.MED_GEMMA] = agent
-        logger.info(f"Created Med-Gemma agent with {model_name}")
+        logger.info("Created Med-Gemma agent with %s", model_name)
+        return agent
 
     async def _get_research_tools(self) -> list:
         """Get research tools based on privacy mode."""
@@ -199,7 +292,7 @@ class MigruCore:
 
         # Only add search tools if privacy mode allows
         if (
-            self.privacy_mode in ["hybrid", "flexible"]
+            self.privacy_mode in ONLINE_PRIVACY_MODES
             and config.ENABLE_SEARCH_IN_LOCAL_MODE
         ):
             from app.tools import SmartSearchTools
@@ -219,6 +312,8 @@ class MigruCore:
         message: str,
         stream: bool = True,
         context: Dict[str, Any] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
     ) -> Any:
         """
         Process a message using intelligent routing and local models.
@@ -227,13 +322,15 @@ class MigruCore:
             message: User's message
             stream: Whether to stream the response
             context: Additional context (user mood, history, etc.)
+            user_id: User the message belongs to
+            session_id: Conversation to continue; turns in one session share
+                a stable prompt prefix that local servers can reuse
 
         Returns:
-            Agent response (streamed or complete)
+            An iterator of reply text chunks when streaming, else the
+            complete agent response
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Determine appropriate agent mode
@@ -242,61 +339,69 @@ class MigruCore:
             self.current_mode = mode
             agent = self.agents[mode]
 
-            logger.debug(f"Routing to {mode.value} mode")
+            logger.debug("Routing to %s mode", mode.value)
 
             # Execute with selected agent
-            response = await self._execute_with_agent(agent, message, stream)
+            response = await self._execute_with_agent(
+                agent, message, stream, user_id=user_id, session_id=session_id
+            )
 
-            # Track performance
-            response_time = time.time() - start_time
-            self.response_times.append(response_time)
+            # Track performance. Streams are timed when fully drained so the
+            # caller can start consuming chunks without waiting on bookkeeping.
+            if stream:
+                return self._timed_stream(response, start_time)
 
-            logger.info(f"Response completed in {response_time:.2f}s")
+            self._record_time(time.perf_counter() - start_time)
             return response
 
         except Exception as e:
             # Track error
-            error_type = type(e).__name__
-            self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+            self.error_counts[type(e).__name__] += 1
 
-            logger.error(f"Message processing failed: {e}")
+            logger.error("Message processing failed: %s", e)
 
             # Try fallback
             return await self._handle_fallback(message, stream, context)
 
+    def _timed_stream(self, stream: Iterator[Any], start_time: float) -> Iterator[str]:
+        """Yield the text of each streamed chunk and record the total time."""
+        try:
+            for chunk in stream:
+                text = chunk if isinstance(chunk, str) else getattr(chunk, "content", None)
+                if isinstance(text, str) and text:
+                    yield text
+        finally:
+            self._record_time(time.perf_counter() - start_time)
+
+    def _record_time(self, response_time: float) -> None:
+        """Record a response time in the bounded performance window."""
+        if len(self.response_times) == self.response_times.maxlen:
+            self._rt_sum -= self.response_times[0]
+        self.response_times.append(response_time)
+        self._rt_sum += response_time
+
+        logger.info("Response completed in %.2fs", response_time)
+
     def _route_query(self, message: str) -> AgentMode:
-        """Simple keyword-based routing for speed."""
-        msg = message.lower().strip()
-        
-        # Med-Gemma triggers
-        med_keywords = {"symptom", "diagnosis", "medical", "doctor", "clinical", "med-gemma", "gemma", "haidef"}
-        
-        research_keywords = {"research", "find", "search", "study", "evidence", "science", "proven", "weather"}
-        advisor_keywords = {"how to", "help me", "guide", "protocol", "routine", "plan", "start", "try", "advice"}
-        
-        if any(k in msg for k in med_keywords):
-            return AgentMode.MED_GEMMA
-        if any(k in msg for k in research_keywords):
-            return AgentMode.RESEARCHER
-        if any(k in msg for k in advisor_keywords):
-            return AgentMode.ADVISOR
-            
-        return AgentMode.COMPANION
+        """Simple keyword-based routing for speed, falling back to an agent that exists."""
+        mode = _route_query_cached(message.lower().strip())
+        if mode not in self.agents:
+            return AgentMode.COMPANION
+        return mode
 
     async def _execute_with_agent(
         self,
         agent: Agent,
         message: str,
         stream: bool,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
     ) -> Any:
         """Execute message with specific agent."""
         try:
-            if stream:
-                return agent.run(message, stream=True)
-            else:
-                return agent.run(message, stream=False)
+            return agent.run(message, stream=stream, user_id=user_id, session_id=session_id)
         except Exception as e:
-            logger.error(f"Agent execution failed: {e}")
+            logger.error("Agent execution failed: %s", e)
             raise
 
     async def _handle_fallback(
@@ -320,7 +425,7 @@ class MigruCore:
             return "I'm having difficulty right now. Could you try rephrasing that?"
 
         except Exception as e:
-            logger.error(f"Fallback also failed: {e}")
+            logger.error("Fallback also failed: %s", e)
             return "I need a moment to recover. Please try again in a little while."
 
     def switch_privacy_mode(self, mode: str) -> bool:
@@ -337,14 +442,17 @@ class MigruCore:
             old_mode = self.privacy_mode
             self.privacy_mode = mode
 
-            logger.info(f"Switched privacy mode: {old_mode} -> {mode}")
+            logger.info("Switched privacy mode: %s -> %s", old_mode, mode)
 
-            # Recreate agents with new privacy settings
-            asyncio.create_task(self._recreate_agents())
+            # Recreate agents with new privacy settings, superseding any
+            # rebuild still in flight from a previous switch
+            if self._recreate_task and not self._recreate_task.done():
+                self._recreate_task.cancel()
+            self._recreate_task = asyncio.create_task(self._recreate_agents())
 
             return True
         else:
-            logger.warning(f"Invalid privacy mode: {mode}")
+            logger.warning("Invalid privacy mode: %s", mode)
             return False
             
     def get_current_mode(self) -> AgentMode:
@@ -355,33 +463,41 @@ class MigruCore:
         """Manually switch to a specific agent mode."""
         if mode in self.agents:
             self.current_mode = mode
-            logger.info(f"Switched to {mode.value} mode")
+            logger.info("Switched to %s mode", mode.value)
         else:
             raise ValueError(f"Invalid mode: {mode}")
 
     async def _recreate_agents(self):
         """Recreate agents after privacy mode change."""
         try:
-            self.agents.clear()
-            await self._create_initial_agents()
+            new_agents = await self._create_initial_agents()
+            self.agents = new_agents
             logger.info("Agents recreated after privacy mode change")
         except Exception as e:
-            logger.error(f"Failed to recreate agents: {e}")
+            logger.error("Failed to recreate agents: %s", e)
+
+    def _available_model_names(self) -> list[str]:
+        """List scanned local models, or nothing when local LLMs are disabled."""
+        if not self.local_llm_enabled:
+            return []
+        from app.models.local_llm import model_manager
+
+        return list(model_manager.available_models.keys())
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status."""
         return {
             "privacy_mode": self.privacy_mode,
             "local_llm_enabled": self.local_llm_enabled,
-            "available_models": list(model_manager.available_models.keys()) if self.local_llm_enabled else [],
+            "available_models": self._available_model_names(),
             "active_agents": [k.value for k in self.agents.keys()],
             "current_mode": self.current_mode.value,
             "performance": {
-                "avg_response_time": sum(self.response_times) / len(self.response_times)
+                "avg_response_time": self._rt_sum / len(self.response_times)
                 if self.response_times
                 else 0,
                 "total_responses": len(self.response_times),
-                "error_counts": self.error_counts,
+                "error_counts": dict(self.error_counts),
             },
         }
 
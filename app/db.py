@@ -1,3 +1,4 @@
+import functools
 import subprocess
 import time
 
@@ -8,20 +9,46 @@ from app.logger import get_logger
 
 logger = get_logger("migru.db")
 
+# Successful health checks are trusted for this many seconds
+REDIS_CHECK_TTL = 30.0
+_redis_ok_until: float = 0.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_redis_client():
+    """Shared Redis client so health checks reuse one connection pool."""
+    from redis import Redis
+
+    return Redis.from_url(config.REDIS_URL)
+
+
+def get_redis_client():
+    """Plain Redis client on the shared connection pool, for key/value helpers."""
+    return _get_redis_client()
+
+
 def ensure_redis_running() -> bool:
     """Checks if redis-server is running and attempts to start it if not."""
-    from redis import Redis
-    
+    if time.monotonic() < _redis_ok_until:
+        return True
+
     def check_connection():
+        global _redis_ok_until
         try:
-            client = Redis.from_url(config.REDIS_URL)
-            return client.ping()
+            if _get_redis_client().ping():
+                _redis_ok_until = time.monotonic() + REDIS_CHECK_TTL
+                return True
+            return False
         except Exception:
             return False
 
     if check_connection():
         return True
 
+    if not config.REDIS_AUTOSTART:
+        logger.debug("Redis is not reachable and autostart is disabled.")
+        return False
+
     # Downgraded to debug to reduce CLI noise
     logger.debug("Redis is not running. Attempting to start redis-server...")
     try:
@@ -32,13 +59,20 @@ def ensure_redis_running() -> bool:
             stderr=subprocess.DEVNULL
         )
         
-        # Wait up to 5 seconds for it to become available
-        for _ in range(10):
-            time.sleep(0.5)
+        # Wait up to 5 seconds for it to become available, polling with
+        # exponential backoff so a fast start isn't held up by a fixed sleep
+        deadline = time.monotonic() + 5
+        delay = 0.02
+        while True:
             if check_connection():
                 logger.debug("Redis server started successfully.")
                 return True
-                
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 0.5)
+
         logger.debug("Redis server started but failed to respond to ping.")
         return False
     except FileNotFoundError:
@@ -48,8 +82,17 @@ def ensure_redis_running() -> bool:
         logger.debug(f"Could not start redis-server: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def get_db() -> RedisDb:
+    """Return the shared RedisDb so every caller uses one connection pool."""
     return RedisDb(db_url=config.REDIS_URL)
 
+
+def reset_db_cache() -> None:
+    """Drop the cached RedisDb so the next get_db() builds a fresh one."""
+    get_db.cache_clear()
+    _get_redis_client.cache_clear()
+
+
 # Global db instance
 db = get_db()
@@ -0,0 +1,42 @@
+"""
+Redis-backed cache of complete agent replies.
+
+Replies are keyed by sha256(mode | user | session | normalised prompt), so a
+follow-up such as "tell me more" only matches within its own conversation and
+routed mode. Entries expire after config.LLM_CACHE_TTL seconds. Redis being
+unavailable is treated as a miss.
+"""
+import hashlib
+from typing import Optional
+
+from app.config import config
+from app.db import get_redis_client
+from app.logger import get_logger
+
+logger = get_logger("migru.llm_cache")
+
+KEY_PREFIX = "llm_cache:"
+
+
+def make_key(mode: str, user_id: str, session_id: str, prompt: str) -> str:
+    """Cache key for a prompt; case and surrounding whitespace are ignored."""
+    raw = f"{mode}|{user_id}|{session_id}|{prompt.strip().lower()}"
+    return KEY_PREFIX + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached reply for ``key``, or None on a miss."""
+    try:
+        value = get_redis_client().get(key)
+    except Exception as e:
+        logger.debug("LLM cache lookup failed: %s", e)
+        return None
+    return value.decode("utf-8") if value is not None else None
+
+
+def set(key: str, value: str, ttl: Optional[int] = None) -> None:
+    """Store a reply under ``key`` for ``ttl`` seconds (config.LLM_CACHE_TTL by default)."""
+    try:
+        get_redis_client().set(key, value, ex=ttl or config.LLM_CACHE_TTL)
+    except Exception as e:
+        logger.debug("LLM cache store failed: %s", e)
@@ -1,13 +1,134 @@
 import logging
+import os
 import sys
+import time
 import traceback
+import warnings
 from collections.abc import Callable
+from collections.abc import Iterable
+from functools import lru_cache
 from functools import wraps
 from typing import Any
 
 
+# None of our formats use thread/process fields or caller location, so skip
+# collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+logging._srcfile = None
+
+# Third-party logger namespaces silenced by suppress_verbose_logging
+_SILENCE_PREFIXES = ("agno", "redis", "mistral", "cerebras", "openai")
+
+# Agno loggers and AI providers silenced by name, whether or not they exist yet
+_EXPLICIT_SILENCED = frozenset([
+    "agno",
+    "agno.tools",
+    "agno.agent",
+    "agno.team",
+    "agno.memory",
+    "agno.culture",
+    "agno.db",
+    "agno.storage",
+    "agno.utils",
+    "agno.models",
+    "agno.models.base",
+    "agno.agent.agent",
+    # Function execution and retry warnings
+    "agno.tools.function",
+    "agno.agent.run",
+    "agno.models.retry",
+    "redis",
+    "httpx",
+    "httpcore",
+    "ddgs",
+    "firecrawl",
+    "requests",
+    "urllib3",
+    "mistralai",
+    "cerebras",
+    "cerebras_cloud_sdk",
+    "openai",
+    "pathway",
+    "youtube_transcript_api",
+])
+
+# NullHandler is stateless, so every silenced logger can share one instance
+_NULL_HANDLER = logging.NullHandler()
+
+# Handle on the current process for log_memory_usage (psutil is optional)
+try:
+    import psutil
+
+    _PROCESS = psutil.Process()
+except ImportError:
+    _PROCESS = None
+
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Set once suppress_verbose_logging has done its full pass
+_SUPPRESSED = False
+# Logger names already checked against _SILENCE_PREFIXES
+_SEEN_LOGGERS: set[str] = set()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders asctime once per second instead of once per record."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (unix second, rendered string), swapped as one tuple so threads
+        # never see a mismatched pair
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is None or datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached_time
+        if sec != cached_sec:
+            cached_str = time.strftime(datefmt, self.converter(sec))
+            self._cached_time = (sec, cached_str)
+        return cached_str
+
+
+# Structured formatter shared by every logger from get_logger. Its datefmt has
+# one-second resolution, so cached timestamps are exact.
+_STRUCTURED_FORMATTER = _CachedTimeFormatter(
+    '%(asctime)s [%(levelname)8s] %(name)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class _NoopLogger:
+    """Stand-in logger for quiet mode: every call returns without touching logging."""
+
+    name = "noop"
+    handlers: list[logging.Handler] = []
+
+    def _noop(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    debug = info = warning = error = exception = critical = log = _noop
+    setLevel = addHandler = removeHandler = _noop
+
+    def isEnabledFor(self, level: int) -> bool:
+        return False
+
+
+# Opt-in silent mode: MIGRU_QUIET=1 makes get_logger hand out a no-op logger
+_QUIET = os.environ.get("MIGRU_QUIET") == "1"
+_NOOP_LOGGER = _NoopLogger()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger instance with structured logging configuration."""
+    """Get a logger instance with structured logging configuration (memoized per name)."""
+    if _QUIET:
+        return _NOOP_LOGGER
+
     logger = logging.getLogger(name)
 
     if not logger.handlers:
@@ -20,12 +141,7 @@ def get_logger(name: str) -> logging.Logger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
 
-        # Create structured formatter
-        formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)8s] %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_STRUCTURED_FORMATTER)
 
         # Add handler to logger
         logger.addHandler(console_handler)
@@ -34,110 +150,158 @@ def get_logger(name: str) -> logging.Logger:
 
 
 def log_function_calls(logger: logging.Logger) -> Callable:
-    """Decorator to log function entry/exit and exceptions."""
+    """
+    Decorator to log function entry/exit and exceptions.
+
+    The wrapper is chosen once, at decoration time, from the logger's level:
+    full entry/exit tracing when DEBUG is on, exception logging only when
+    ERROR is on, and the undecorated function when neither would be emitted.
+    """
     def decorator(func: Callable) -> Callable:
+        if not logger.isEnabledFor(logging.ERROR):
+            return func
+
+        # Bind per-function constants once instead of looking them up per call
+        name = func.__name__
+        logger_debug = logger.debug
+        logger_error = logger.error
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            # exc_info defers traceback rendering to the handler, so it is
+            # only built if the record is actually emitted
+            @wraps(func)
+            def wrapper_errors_only(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger_error("Exception in %s: %s", name, e, exc_info=True)
+                    raise
+            return wrapper_errors_only
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.debug(f"Entering {func.__name__}")
+            logger_debug("Entering %s", name)
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"Exiting {func.__name__} successfully")
+                logger_debug("Exiting %s successfully", name)
                 return result
             except Exception as e:
-                logger.error(f"Exception in {func.__name__}: {str(e)}")
-                logger.debug(f"Stack trace: {traceback.format_exc()}")
+                logger_error("Exception in %s: %s", name, e)
+                # format_exc walks the whole stack, so only pay for it when shown
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger_debug("Stack trace: %s", traceback.format_exc())
                 raise
         return wrapper
     return decorator
 
 
 def suppress_verbose_logging() -> None:
-    """Suppress verbose logging from third-party libraries and Agno tools."""
-    
-    # Aggressively silence agno loggers and AI providers
-    loggers_to_silence = [
-        "agno",
-        "agno.tools",
-        "agno.agent", 
-        "agno.team",
-        "agno.memory",
-        "agno.culture",
-        "agno.db",
-        "agno.storage",
-        "agno.utils",
-        "agno.models",
-        "agno.models.base",
-        "agno.agent.agent",
-        "redis",
-        "httpx",
-        "httpcore", 
-        "ddgs",
-        "firecrawl",
-        "requests",
-        "urllib3",
-        "mistralai",
-        "cerebras",
-        "cerebras_cloud_sdk",
-        "openai",
-        "pathway",
-        "youtube_transcript_api",
-    ]
-
-    for logger_name in loggers_to_silence:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.CRITICAL)
-        logger.handlers = [] # Remove specific handlers to force bubble-up
-        logger.propagate = False # STOP propagation to root (which might print WARNINGs)
-        logger.addHandler(logging.NullHandler()) # Swallow everything
-
-    # Brute force: check all existing loggers
-    for name in logging.root.manager.loggerDict:
-        if any(name.startswith(prefix) for prefix in ["agno", "redis", "mistral", "cerebras", "openai"]):
-            logger = logging.getLogger(name)
-            logger.setLevel(logging.CRITICAL)
-            logger.handlers = []
-            logger.propagate = False
-            logger.addHandler(logging.NullHandler())
-
-    # Suppress all function execution warnings and retry warnings
-    logging.getLogger("agno.tools.function").setLevel(logging.CRITICAL)
-    logging.getLogger("agno.agent.run").setLevel(logging.CRITICAL)
-    logging.getLogger("agno.models.retry").setLevel(logging.CRITICAL)
+    """
+    Suppress verbose logging from third-party libraries and Agno tools.
+
+    The full pass runs once; later calls only silence loggers created since.
+    """
+    global _SUPPRESSED
+    if _SUPPRESSED:
+        _resilence_new()
+        return
+    _SUPPRESSED = True
+
+    # Keep the CLI free of library warnings too; installed once here so
+    # callers don't each add their own filter.
+    warnings.filterwarnings("ignore")
+
+    # One pass over the explicit names plus every existing logger (brute
+    # force), under a single acquisition of the logging module lock.
+    # Iterate a snapshot because getLogger() can replace placeholders in
+    # loggerDict while we walk it.
+    manager = logging.root.manager
+    with logging._lock:
+        names = list(manager.loggerDict)
+        for name in _EXPLICIT_SILENCED.union(names):
+            if name in _EXPLICIT_SILENCED or name.startswith(_SILENCE_PREFIXES):
+                _silence(name)
+        _SEEN_LOGGERS.update(manager.loggerDict)
+        manager._clear_cache()
 
     # Keep only warnings and errors visible for user-facing logs (unless overridden by main)
     # But since we want to be very quiet, we let main handle the root logger level.
     # logging.getLogger().setLevel(logging.WARNING) 
 
 
+def _silence(name: str) -> None:
+    """
+    Mute a single logger completely.
+
+    Attributes are written directly rather than through setLevel/addHandler,
+    which would each take the logging lock again; callers hold the lock and
+    clear the level cache once afterwards. ``disabled`` makes Logger.handle
+    drop records before any further work.
+    """
+    logger = logging.getLogger(name)
+    logger.level = logging.CRITICAL
+    logger.handlers = [_NULL_HANDLER] # Swallow everything
+    logger.propagate = False # STOP propagation to root (which might print WARNINGs)
+    logger.disabled = True
+
+
+def quiet_loggers(names: Iterable[str]) -> None:
+    """Mute the named loggers (and their children) for the rest of the process."""
+    with logging._lock:
+        for name in names:
+            _silence(name)
+        logging.root.manager._clear_cache()
+
+
+def _resilence_new() -> None:
+    """Silence prefix-matched loggers that appeared since the last scan."""
+    manager = logging.root.manager
+    with logging._lock:
+        names = list(manager.loggerDict)
+        for name in names:
+            if name not in _SEEN_LOGGERS and name.startswith(_SILENCE_PREFIXES):
+                _silence(name)
+        _SEEN_LOGGERS.update(names)
+        manager._clear_cache()
+
+
 class PerformanceLogger:
     """Context manager for performance logging."""
 
+    __slots__ = ("logger", "operation_name", "start_time")
+
+    # Monotonic, high-resolution clock bound once on the class
+    _clock = staticmethod(time.perf_counter)
+
     def __init__(self, logger: logging.Logger, operation_name: str):
         self.logger = logger
         self.operation_name = operation_name
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = self.logger.perf_counter()
-        self.logger.debug(f"Starting {self.operation_name}")
+        self.start_time = self._clock()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Starting %s", self.operation_name)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = self.logger.perf_counter()
+        end_time = self._clock()
         duration = end_time - self.start_time
-        self.logger.info(f"{self.operation_name} completed in {duration:.2f} seconds")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("%s completed in %.2f seconds", self.operation_name, duration)
 
         if exc_type:
-            self.logger.error(f"{self.operation_name} failed with {exc_type.__name__}: {exc_val}")
+            self.logger.error(
+                "%s failed with %s: %s", self.operation_name, exc_type.__name__, exc_val
+            )
 
 
 def log_memory_usage(logger: logging.Logger) -> None:
     """Log current memory usage if psutil is available."""
-    try:
-        import psutil
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024
-        logger.debug(f"Memory usage: {memory_mb:.2f} MB")
-    except ImportError:
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if _PROCESS is None:
         logger.debug("psutil not available, skipping memory logging")
+        return
+    memory_info = _PROCESS.memory_info()
+    logger.debug("Memory usage: %.2f MB", memory_info.rss * _BYTES_TO_MB)
@@ -2,44 +2,368 @@
 Migru - Revolutionary AI Companion for Migraine & Stress Relief
 Complete redesign focusing on therapeutic UX, speed, and deep research capabilities.
 """
-import argparse
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import functools
+import importlib
 import os
+import queue
+import re
 import sys
-import warnings
+import threading
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Optional
 import typer
 
-# Suppress ALL warnings early - keep CLI clean
-warnings.filterwarnings("ignore")
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.formatted_text import HTML
+
+# Keep the CLI clean: the root logger stays at CRITICAL and
+# suppress_verbose_logging() below also silences warnings.
 import logging
 logging.getLogger().setLevel(logging.CRITICAL)
-logging.basicConfig(level=logging.CRITICAL, force=True)
-
-from prompt_toolkit import PromptSession
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.shortcuts import CompleteStyle
-from prompt_toolkit.styles import Style as PTStyle
-from rich import box
-from rich.align import Align
-from rich.console import Console, Group
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+
+# prompt_toolkit and the rich renderables are imported inside the methods that
+# use them, so `--help` and non-interactive commands don't pay for them.
+from rich.console import Console
+from rich.style import Style
+from rich.text import Text
 
 from app.config import config
 from app.exceptions import MigruError
-from app.logger import get_logger, suppress_verbose_logging
-from app.ui.theme import Themes
+from app.logger import get_logger, quiet_loggers, suppress_verbose_logging
 
 # Suppress verbose logging
 suppress_verbose_logging()
 
 logger = get_logger("migru.main")
-console = Console()
+# Output is styled explicitly and emoji are literal, so skip the highlighter
+# and :shortcode: passes on every print
+console = Console(highlight=False, emoji=False)
+
+# 4-7-8 breathing: (label, seconds, one dot string per second of the phase).
+_BREATH_PHASES = tuple(
+    (label, seconds, tuple("  " + mark * (i + 1) for i in range(seconds)))
+    for label, seconds, mark in (
+        ("[green]Breathe in slowly...[/green]", 4, "●"),
+        ("[yellow]Hold gently...[/yellow]", 7, "○"),
+        ("[blue]Breathe out slowly...[/blue]", 8, "~"),
+    )
+)
+_BREATH_CYCLE_SECONDS = sum(seconds for _, seconds, _ in _BREATH_PHASES)
+
+
+def _breath_frame(cycle: int, offset: float, cycles: int) -> Optional[str]:
+    """Breathing display ``offset`` seconds into ``cycle``; None in the pause after it."""
+    for label, seconds, frames in _BREATH_PHASES:
+        if offset < seconds:
+            return (
+                f"[bold cyan]Cycle {cycle + 1}/{cycles}[/bold cyan]\n"
+                f"{label} [dim]({seconds} seconds)[/dim]\n{frames[int(offset)]}"
+            )
+        offset -= seconds
+    return None
+
+
+# Prompt markup indexed by min(conversation_count, 3).
+_PROMPT_MARKUP = (
+    '<b><style fg="#00FFFF">🌸</style></b> <style fg="#888888">Share what\'s on your mind</style> › ',
+    '<b><style fg="#00FFFF">💭</style></b> <style fg="#888888">Continue</style> › ',
+    '<b><style fg="#00FFFF">💭</style></b> <style fg="#888888">Continue</style> › ',
+    '<b><style fg="#00FFFF">•</style></b> › ',
+)
+
+# Styles and separator reused by every response, so Rich never re-parses
+# markup for them.
+_STYLE_TITLE = Style(color="magenta", bold=True)
+_STYLE_DIM = Style(dim=True)
+_HR_TEXT = Text("─" * 60)
+
+# Phrases that end the session when they appear as whole words in a message.
+_EXIT_PHRASES = ("bye", "goodbye", "farewell", "see you", "gotta go", "have to go")
+_EXIT_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _EXIT_PHRASES)) + r")\b", re.IGNORECASE
+)
+
+# Messages shorter than this ("ok", "yes", "lol") carry no pattern signal
+# and make poor cache keys.
+_MIN_SIGNAL_CHARS = 6
+
+# Our loggers that would otherwise print into the chat while an agent runs;
+# muted once at startup (failures surface as the fallback reply instead).
+# Library loggers are already muted by suppress_verbose_logging().
+_AGENT_RUN_LOGGERS = (
+    "migru.core",
+    "migru.local_llm",
+    "migru.router",
+    "migru.tools",
+    "migru.privacy_tools",
+)
+
+# Pattern events are written to Redis in batches of this many turns
+_EVENT_BATCH_SIZE = 10
+
+# Max seconds streamed text may sit in the output buffer before being written.
+STREAM_FLUSH_INTERVAL = 0.03
+
+# [monotonic time of last refresh, local hour]
+_hour_cache = [0.0, -1]
+
+
+def _current_hour() -> int:
+    """Local hour of day, re-read from the clock at most once a minute."""
+    now = time.monotonic()
+    if now - _hour_cache[0] > 60 or _hour_cache[1] < 0:
+        _hour_cache[:] = [now, time.localtime().tm_hour]
+    return _hour_cache[1]
+
+# Lazily imported services: name -> "module:attribute".
+_SERVICE_SPECS = {
+    "personalization": "app.agents:personalization_engine",
+    "pattern_detector": "app.services.realtime_analytics:pattern_detector",
+    "insight_extractor": "app.services.user_insights:insight_extractor",
+    "context_manager": "app.services.context:context_manager",
+}
+
+# /model aliases backed by config attributes, resolved when /model runs.
+_MODEL_CONFIG_ATTRS = {
+    "mistral-creative": "MODEL_MISTRAL_CREATIVE",
+    "mistral-small": "MODEL_MISTRAL_SMALL",
+    "mistral-medium": "MODEL_MISTRAL_MEDIUM",
+    "mistral-large": "MODEL_MISTRAL_LARGE",
+    "cerebras": "MODEL_FAST",
+}
+_FIXED_MODELS = {
+    "openai": "openai:gpt-4o",
+    "openai-gpt4": "openai:gpt-4o",
+}
+
+
+# Base prompt_toolkit style rules for the input session.
+_PROMPT_STYLE_RULES = {
+    'prompt': '#00FFFF bold',
+    '': '#FFFFFF',
+    "completion-menu.completion": "bg:#008888 #ffffff",
+    "completion-menu.completion.current": "bg:#00aaaa #000000",
+    "scrollbar.background": "bg:#88aaaa",
+    "scrollbar.button": "bg:#222222",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _prompt_style() -> Any:
+    """Compile _PROMPT_STYLE_RULES once per process."""
+    from prompt_toolkit.styles import Style as PTStyle
+
+    return PTStyle.from_dict(_PROMPT_STYLE_RULES)
+
+
+@functools.lru_cache(maxsize=1)
+def _devnull() -> Any:
+    """Shared os.devnull handle, opened on first use and closed at exit."""
+    handle = open(os.devnull, "w")
+    atexit.register(handle.close)
+    return handle
+
+
+@contextlib.contextmanager
+def _silenced():
+    """Send stderr to devnull while the agents run."""
+    old_stderr = sys.stderr
+    sys.stderr = _devnull()
+    try:
+        yield
+    finally:
+        sys.stderr = old_stderr
+
+
+@functools.lru_cache(maxsize=1)
+def _exit_matcher() -> Any:
+    """Predicate telling whether a message contains an exit phrase.
+
+    Uses a Hyperscan database when the optional ``hyperscan`` package is
+    installed, so the scan stays linear however many phrases there are;
+    otherwise falls back to ``_EXIT_RE``.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return lambda text: _EXIT_RE.search(text) is not None
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[_EXIT_RE.pattern.encode()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8],
+    )
+
+    def on_match(*_: Any) -> bool:
+        return True  # first match is enough; stop scanning
+
+    def is_exit(text: str) -> bool:
+        try:
+            db.scan(text.encode("utf-8"), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    return is_exit
+
+
+def _resolve_model_alias(name: str) -> Optional[str]:
+    """Resolve a /model alias to its "provider:model" id."""
+    key = name.lower()
+    attr = _MODEL_CONFIG_ATTRS.get(key)
+    return getattr(config, attr) if attr else _FIXED_MODELS.get(key)
+
+
+@functools.lru_cache(maxsize=None)
+def _materialise(spec: str) -> Any:
+    """Import and return the object named by a "module:attribute" spec."""
+    module_name, attr = spec.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+@functools.lru_cache(maxsize=16)
+def _rendered(build: Any, width: int) -> str:
+    """ANSI output of a static screen from ``build`` at ``width`` columns, rendered once."""
+    with console.capture() as capture:
+        console.print(build())
+    return capture.get()
+
+
+@functools.lru_cache(maxsize=1)
+def _help_panel() -> Any:
+    """Build the static /help panel once per process."""
+    from rich import box
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    help_table = Table(
+        show_header=False,
+        box=box.SIMPLE,
+        padding=(0, 2),
+        collapse_padding=True
+    )
+    help_table.add_column("Command", style="cyan", no_wrap=True)
+    help_table.add_column("Description", style="white")
+
+    # Organize by category
+    help_table.add_row("[bold]💬 Core[/bold]", "")
+    help_table.add_row("/help", "Show this help")
+    help_table.add_row("/exit", "End session gracefully")
+    help_table.add_row("/clear", "Clear screen")
+
+    help_table.add_row("", "")
+    help_table.add_row("[bold]🌿 Wellness[/bold]", "")
+    help_table.add_row("/work", "Toggle Work Mode (Stealth/Discreet)")
+    help_table.add_row("/breathe", "Guided breathing (3 min)")
+    help_table.add_row("/relief", "Quick relief menu")
+    help_table.add_row("/med <q>", "Med-Gemma clinical insight")
+    help_table.add_row("/privacy [mode]", "Switch privacy (local/hybrid/flexible)")
+    help_table.add_row("/research <q>", "Deep research")
+    help_table.add_row("/exit", "End session")
+
+    help_table.add_row("", "")
+    help_table.add_row("[bold]📊 Personal[/bold]", "")
+    help_table.add_row("/profile", "View your profile")
+    help_table.add_row("/patterns", "See wellness patterns")
+    help_table.add_row("/stats", "Session statistics")
+
+    help_table.add_row("", "")
+    help_table.add_row("[bold]🔍 Research[/bold]", "")
+    help_table.add_row("/research <query>", "Deep research mode")
+    help_table.add_row("/mode [name]", "View/switch agent mode")
+    help_table.add_row("/model [name]", "View/switch AI model")
+
+    help_table.add_row("", "")
+    help_table.add_row("[bold]⚡ Shortcuts[/bold]", "")
+    help_table.add_row("Ctrl+R", "Quick research")
+    help_table.add_row("Ctrl+P", "Show patterns")
+    help_table.add_row("Ctrl+H", "Quick help")
+
+    panel = Panel(
+        Group(
+            help_table,
+            "\n[dim]💡 Tip: Just type naturally - I'll understand your intent[/dim]"
+        ),
+        title="[bold cyan]💡 Commands & Shortcuts[/bold cyan]",
+        border_style="cyan",
+        box=box.ROUNDED,
+        padding=(1, 2)
+    )
+    return panel
+
+
+@functools.lru_cache(maxsize=1)
+def _error_panel() -> Any:
+    """Build the "try again" panel shown when a turn fails, once per process."""
+    from rich import box
+    from rich.panel import Panel
+
+    # Parsed up front; a plain string would be re-parsed on every render
+    return Panel(
+        Text.from_markup(
+            "[yellow]I'm having a moment of difficulty[/yellow]\n\n"
+            "[white]Let's try that again, or rephrase if needed[/white]\n\n"
+            "[dim]Your message is important to me 🌸[/dim]"
+        ),
+        border_style="yellow",
+        box=box.ROUNDED
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _relief_screen() -> Any:
+    """Build the static /relief screen once per process."""
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
+
+    relief_table = Table(
+        show_header=False,
+        box=box.ROUNDED,
+        title="[bold green]🌿 Quick Relief Options[/bold green]"
+    )
+    relief_table.add_column("Action", style="green", no_wrap=True)
+    relief_table.add_column("Description", style="white")
+
+    relief_table.add_row("🫁 /breathe", "Guided breathing exercise (3 min)")
+    relief_table.add_row("🌊 /patterns", "View your wellness patterns")
+    relief_table.add_row("💭 Ask me", "Share what you're feeling")
+    relief_table.add_row("🔍 /research", "Find relief techniques")
+    return Group("", relief_table, "", "[dim]Or just tell me what you need...[/dim]")
+
+
+@functools.lru_cache(maxsize=4)
+def _models_table(entries: tuple) -> Any:
+    """Build the /model table for a catalog snapshot."""
+    from rich import box
+    from rich.table import Table
+
+    models_table = Table(
+        show_header=True,
+        box=box.ROUNDED,
+        title="[bold cyan]🤖 Available AI Models[/bold cyan]",
+        title_style="bold cyan"
+    )
+    models_table.add_column("Model", style="cyan", no_wrap=True)
+    models_table.add_column("Provider", style="white")
+    models_table.add_column("Speed", style="yellow")
+    models_table.add_column("Intelligence", style="magenta")
+
+    for model, provider, speed, intel, available in entries:
+        if available is False:
+            model = f"[dim]{model} (unavailable)[/dim]"
+        models_table.add_row(model, provider, speed, intel)
+    return models_table
 
 
 class TherapeuticCLI:
@@ -48,56 +372,131 @@ class TherapeuticCLI:
     Designed for therapeutic wellness support with power-user capabilities.
     """
     
+    # Therapeutic color palette
+    COLORS: ClassVar[dict[str, str]] = {
+        "primary": "magenta",
+        "calm": "cyan",
+        "warmth": "yellow",
+        "nature": "green",
+        "alert": "red",
+        "neutral": "white",
+        "whisper": "dim"
+    }
+    
+    _kb = None  # Shared KeyBindings, built on first use
+    
+    __slots__ = (
+        "user_name",
+        "console",
+        "conversation_count",
+        "session_start",
+        "_session_id",
+        "_migru_core",
+        "_services",
+        "_ctx_mgr",
+        "_pattern",
+        "_event_q",
+        "_turn_services_ready",
+        "_prompt_cache",
+        "_completer",
+        "_validator",
+        "_models_refresh",
+        "_exact_commands",
+        "_arg_commands",
+        "kb",
+        "palette",
+        "history",
+        "_preferred_model",
+    )
+    
     def __init__(self, user_name: str = "Friend"):
         self.user_name = user_name
         self.console = console
         self.conversation_count = 0
         self.session_start = datetime.now()
+        # One agent session per chat, so each turn extends the same history
+        self._session_id = f"{user_name}-{self.session_start:%Y%m%d%H%M%S}"
         
         # Lazy load heavy dependencies
         self._migru_core = None
         self._services = {}
-        
-        # Key bindings for power users
-        self.kb = KeyBindings()
-        self._setup_keybindings()
-        
-        # Therapeutic color palette
-        self.colors = {
-            "primary": "magenta",
-            "calm": "cyan",
-            "warmth": "yellow",
-            "nature": "green",
-            "alert": "red",
-            "neutral": "white",
-            "whisper": "dim"
+        self._ctx_mgr = None
+        self._pattern = None
+        self._event_q = None
+        self._turn_services_ready = False
+        self._prompt_cache = None
+        self._completer = None
+        self._validator = None
+        self._models_refresh = None
+        self.palette = None
+        self.history = None
+        self._preferred_model = {}
+        
+        # Slash command dispatch, keyed by the command's first token: exact
+        # names, and commands that take the rest of the line as arguments.
+        # Handlers may be sync or async; None means "skip this turn".
+        self._exact_commands = {
+            "/exit": self._exit_session,
+            "/quit": self._exit_session,
+            "/bye": self._exit_session,
+            "/help": self._display_help,
+            "/?": self._display_help,
+            "/clear": self.console.clear,
+            "/profile": self._display_profile,
+            "/patterns": self._display_patterns,
+            "/breathe": self._guided_breathing,
+            "/breath": self._guided_breathing,
+            "/relief": self._quick_relief_menu,
+            "/insights": self._show_session_insights,
+            "/stats": self._display_stats,
+        }
+        self._arg_commands = {
+            "/model": self._model_command,
+            "/mode": self._mode_command,
+            "/research": self._research_command,
+            "/med": self._med_command,
         }
+        
+        # Key bindings for power users; built with the first prompt session so
+        # one-shot commands never import prompt_toolkit
+        self.kb = None
     
-    def _setup_keybindings(self) -> None:
-        """Setup keyboard shortcuts for power users."""
+    @classmethod
+    def _get_kb(cls):
+        """Build the keyboard shortcuts for power users once per process."""
+        if cls._kb is not None:
+            return cls._kb
+        
+        from prompt_toolkit.key_binding import KeyBindings
+        
+        kb = KeyBindings()
+        
         # Ctrl+R for research mode
-        @self.kb.add('c-r')
+        @kb.add('c-r')
         def _(event):
             event.app.exit(result='/research ')
         
         # Ctrl+P for patterns
-        @self.kb.add('c-p')
+        @kb.add('c-p')
         def _(event):
             event.app.exit(result='/patterns')
         
         # Ctrl+H for help
-        @self.kb.add('c-h')
+        @kb.add('c-h')
         def _(event):
             event.app.exit(result='/help')
             
-        @self.kb.add('c-w')
+        @kb.add('c-w')
         def _(event):
             event.app.exit(result='/work')
 
-        @self.kb.add('c-m')
+        @kb.add('c-m')
         def _(event):
             event.app.exit(result='/med ')
 
+        cls._kb = kb
+        return kb
+
     @property
     async def migru_core(self):
         """Lazy load the Migru core system."""
@@ -108,26 +507,22 @@ class TherapeuticCLI:
     
     def get_service(self, service_name: str):
         """Lazy load and cache services."""
-        if service_name not in self._services:
-            if service_name == "personalization":
-                from app.agents import personalization_engine
-                self._services[service_name] = personalization_engine
-            elif service_name == "pattern_detector":
-                from app.services.realtime_analytics import pattern_detector
-                self._services[service_name] = pattern_detector
-            elif service_name == "insight_extractor":
-                from app.services.user_insights import insight_extractor
-                self._services[service_name] = insight_extractor
-            elif service_name == "context_manager":
-                from app.services.context import context_manager
-                self._services[service_name] = context_manager
-        
-        return self._services.get(service_name)
+        service = self._services.get(service_name)
+        if service is None:
+            spec = _SERVICE_SPECS.get(service_name)
+            if spec is None:
+                return None
+            service = self._services.setdefault(service_name, _materialise(spec))
+        return service
     
     def display_welcome(self) -> None:
         """Display a calm, therapeutic welcome screen."""
+        from rich import box
+        from rich.align import Align
+        from rich.console import Group
+        from rich.panel import Panel
+
         self.console.clear()
-        self.console.print()
         
         # Minimalist banner
         banner = Align.center(Panel(
@@ -142,9 +537,6 @@ class TherapeuticCLI:
             padding=(1, 4)
         ))
         
-        self.console.print(banner)
-        self.console.print()
-        
         # Gentle guidance
         guidance = Panel(
             Group(
@@ -159,46 +551,37 @@ class TherapeuticCLI:
             padding=(0, 1)
         )
         
-        self.console.print(Align.center(guidance))
-        self.console.print()
+        self.console.print(Group("", banner, "", Align.center(guidance), ""))
     
     def create_prompt_session(self) -> PromptSession:
         """Create an enhanced prompt session with custom styling."""
-        from app.cli.command_palette import IntelligentCommandPalette
-        
-        self.palette = IntelligentCommandPalette()
-        
-        # Base style dictionary
-        style_dict = {
-            'prompt': '#00FFFF bold',
-            '': '#FFFFFF',
-            "completion-menu.completion": "bg:#008888 #ffffff",
-            "completion-menu.completion.current": "bg:#00aaaa #000000",
-            "scrollbar.background": "bg:#88aaaa",
-            "scrollbar.button": "bg:#222222",
-        }
-        
-        # Add palette styles (simple merge)
-        try:
-            palette_style = self.palette.get_style()
-            # In prompt_toolkit > 3.0, accessing style rules might differ, 
-            # so we'll trust the direct definition above for now.
-        except Exception:
-            pass
-
-        style = PTStyle.from_dict(style_dict)
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.shortcuts import CompleteStyle
+        
+        # Palette, completer and validator are built once and reused by any
+        # later session. The palette's completion-menu style is already part of
+        # _PROMPT_STYLE_RULES.
+        if self._completer is None:
+            from app.cli.command_palette import IntelligentCommandPalette
+            
+            self.palette = IntelligentCommandPalette()
+            self._completer = self.palette.get_completer()
+            self._validator = self.palette.get_validator()
         
         from prompt_toolkit.history import InMemoryHistory
         
-        if not hasattr(self, 'history'):
+        if self.history is None:
             self.history = InMemoryHistory()
+        if self.kb is None:
+            self.kb = type(self)._get_kb()
         
         session = PromptSession(
-            style=style,
+            style=_prompt_style(),
             key_bindings=self.kb,
-            completer=self.palette.get_completer(),
-            validator=self.palette.get_validator(),
+            completer=self._completer,
+            validator=self._validator,
             validate_while_typing=False,
+            complete_in_thread=True,
             history=self.history,
             complete_style=CompleteStyle.MULTI_COLUMN,
             mouse_support=True,
@@ -208,22 +591,13 @@ class TherapeuticCLI:
     
     def get_dynamic_prompt(self) -> HTML:
         """Get a context-aware prompt that evolves with the conversation."""
-        if self.conversation_count == 0:
-            icon = "🌸"
-            text = "Share what's on your mind"
-        elif self.conversation_count < 3:
-            icon = "💭"
-            text = "Continue"
-        else:
-            icon = "•"
-            text = ""
-        
-        if text:
-            return HTML(f'<b><style fg="#00FFFF">{icon}</style></b> <style fg="#888888">{text}</style> › ')
-        else:
-            return HTML(f'<b><style fg="#00FFFF">{icon}</style></b> › ')
+        if self._prompt_cache is None:
+            from prompt_toolkit.formatted_text import HTML
+
+            self._prompt_cache = tuple(HTML(markup) for markup in _PROMPT_MARKUP)
+        return self._prompt_cache[min(self.conversation_count, 3)]
     
-    def handle_command(self, command: str) -> Optional[bool]:
+    async def handle_command(self, command: str) -> Optional[bool]:
         """
         Handle slash commands with power-user features.
         
@@ -232,152 +606,79 @@ class TherapeuticCLI:
             True to exit
             False to skip this turn
         """
-        cmd = command.lower().strip()
-        
-        # Exit commands
-        if cmd in ['/exit', '/quit', '/bye']:
-            self._display_farewell()
-            return True
+        name, *args = command.lower().split(None, 1)
         
-        # Help
-        if cmd in ['/help', '/?']:
-            self._display_help()
-            return False
-        
-        # Clear screen
-        if cmd == '/clear':
-            self.console.clear()
-            return False
-        
-        # Profile & Patterns
-        if cmd == '/profile':
-            self._display_profile()
-            return False
-        
-        if cmd == '/patterns':
-            self._display_patterns()
-            return False
-        
-        # Mode switching (power user feature)
-        if cmd.startswith('/mode'):
-            parts = cmd.split()
-            if len(parts) > 1:
-                self._switch_mode(parts[1])
-            else:
-                self._display_current_mode()
-            return False
-        
-        # Model switching
-        if cmd.startswith('/model'):
-            parts = cmd.split(maxsplit=1)
-            if len(parts) > 1:
-                self._switch_model(parts[1])
-            else:
-                self._display_available_models()
-            return False
-        
-        # Research trigger
-        if cmd.startswith('/research'):
-            query = cmd[len('/research'):].strip()
-            if query:
-                return self._handle_research(query)
-            else:
-                self.console.print("[yellow]Usage: /research <your question>[/yellow]")
-                return False
-        
-        # Breathing exercise
-        if cmd in ['/breathe', '/breath']:
-            await self._guided_breathing()
-            return False
-        
-        # Quick relief
-        if cmd == '/relief':
-            self._quick_relief_menu()
-            return False
-        
-        # Session insights
-        if cmd == '/insights':
-            self._show_session_insights()
-            return False
-        
-        # Quick stats (power user)
-        if cmd == '/stats':
-            self._display_stats()
-            return False
-        
-        if cmd.startswith('/med'):
-            query = cmd[len('/med'):].strip()
-            if query:
-                # Prefix with explicit intent to ensure routing
-                return await self._handle_med_gemma(query)
-            else:
-                self.console.print("[yellow]Usage: /med <symptom description>[/yellow]")
-                return False
-        
-        return None  # Unknown command, continue
+        handler = self._arg_commands.get(name)
+        if handler is not None:
+            result = handler(args[0] if args else "")
+        else:
+            handler = None if args else self._exact_commands.get(name)
+            if handler is None:
+                return None  # Unknown command, continue
+            result = handler()
+        
+        if asyncio.iscoroutine(result):
+            result = await result
+        return False if result is None else result
+    
+    def _exit_session(self) -> bool:
+        """Say goodbye and end the session."""
+        self._display_farewell()
+        return True
+    
+    def _mode_command(self, args: str) -> None:
+        """Show or switch the agent mode."""
+        if args:
+            self._switch_mode(args.split()[0])
+        else:
+            self._display_current_mode()
+    
+    def _model_command(self, args: str) -> None:
+        """Show or switch the AI model."""
+        if args:
+            self._switch_model(args)
+        else:
+            self._display_available_models()
+    
+    def _research_command(self, query: str):
+        """Run a research query, or show usage."""
+        if query:
+            return self._handle_research(query)
+        self.console.print("[yellow]Usage: /research <your question>[/yellow]")
+        return False
+    
+    def _med_command(self, query: str):
+        """Run a Med-Gemma query, or show usage."""
+        if query:
+            return self._handle_med_gemma(query)
+        self.console.print("[yellow]Usage: /med <symptom description>[/yellow]")
+        return False
+    
+    def _print_static(self, build: Any) -> None:
+        """Write a static screen from its cached ANSI rendering.
+
+        Rich would re-measure and re-style the same panel on every print;
+        the rendering is cached per terminal width, so resizes still reflow.
+        """
+        self.console.file.write(_rendered(build, self.console.width))
+        self.console.file.flush()
     
     def _display_help(self) -> None:
         """Display comprehensive help with organized commands."""
-        help_table = Table(
-            show_header=False,
-            box=box.SIMPLE,
-            padding=(0, 2),
-            collapse_padding=True
-        )
-        help_table.add_column("Command", style="cyan", no_wrap=True)
-        help_table.add_column("Description", style="white")
-        
-        # Organize by category
-        help_table.add_row("[bold]💬 Core[/bold]", "")
-        help_table.add_row("/help", "Show this help")
-        help_table.add_row("/exit", "End session gracefully")
-        help_table.add_row("/clear", "Clear screen")
-        
-        help_table.add_row("", "")
-        help_table.add_row("[bold]🌿 Wellness[/bold]", "")
-        help_table.add_row("/work", "Toggle Work Mode (Stealth/Discreet)")
-        help_table.add_row("/breathe", "Guided breathing (3 min)")
-        help_table.add_row("/relief", "Quick relief menu")
-        help_table.add_row("/med <q>", "Med-Gemma clinical insight")
-        help_table.add_row("/privacy [mode]", "Switch privacy (local/hybrid/flexible)")
-        help_table.add_row("/research <q>", "Deep research")
-        help_table.add_row("/exit", "End session")
-        
-        help_table.add_row("", "")
-        help_table.add_row("[bold]📊 Personal[/bold]", "")
-        help_table.add_row("/profile", "View your profile")
-        help_table.add_row("/patterns", "See wellness patterns")
-        help_table.add_row("/stats", "Session statistics")
-        
-        help_table.add_row("", "")
-        help_table.add_row("[bold]🔍 Research[/bold]", "")
-        help_table.add_row("/research <query>", "Deep research mode")
-        help_table.add_row("/mode [name]", "View/switch agent mode")
-        help_table.add_row("/model [name]", "View/switch AI model")
-        
-        help_table.add_row("", "")
-        help_table.add_row("[bold]⚡ Shortcuts[/bold]", "")
-        help_table.add_row("Ctrl+R", "Quick research")
-        help_table.add_row("Ctrl+P", "Show patterns")
-        help_table.add_row("Ctrl+H", "Quick help")
-        
-        panel = Panel(
-            Group(
-                help_table,
-                "\n[dim]💡 Tip: Just type naturally - I'll understand your intent[/dim]"
-            ),
-            title="[bold cyan]💡 Commands & Shortcuts[/bold cyan]",
-            border_style="cyan",
-            box=box.ROUNDED,
-            padding=(1, 2)
-        )
-        
-        self.console.print(panel)
+        self._print_static(_help_panel)
+    
+    def _elapsed(self) -> tuple[int, int]:
+        """Session duration as (minutes, seconds)."""
+        return divmod(int((datetime.now() - self.session_start).total_seconds()), 60)
     
     def _display_farewell(self) -> None:
         """Display a warm, therapeutic farewell."""
-        session_duration = datetime.now() - self.session_start
-        minutes = int(session_duration.total_seconds() / 60)
+        from rich import box
+        from rich.align import Align
+        from rich.console import Group
+        from rich.panel import Panel
+
+        minutes, _ = self._elapsed()
         
         farewell = Panel(
             Align.center(
@@ -391,12 +692,13 @@ class TherapeuticCLI:
             padding=(1, 2)
         )
         
-        self.console.print()
-        self.console.print(farewell)
-        self.console.print()
+        self.console.print(Group("", farewell, ""))
     
     def _display_profile(self) -> None:
         """Display user profile with therapeutic presentation."""
+        from rich import box
+        from rich.panel import Panel
+
         personalization = self.get_service("personalization")
         if not personalization:
             self.console.print("[yellow]Profile not available[/yellow]")
@@ -436,10 +738,14 @@ class TherapeuticCLI:
     
     def _display_patterns(self) -> None:
         """Display discovered wellness patterns."""
+        from rich import box
+        from rich.panel import Panel
+
         pattern_detector = self.get_service("pattern_detector")
         if not pattern_detector:
             self.console.print("[yellow]Pattern detection not available[/yellow]")
             return
+        self._flush_events()  # include this session's latest turns
         
         try:
             patterns = pattern_detector.get_temporal_patterns(self.user_name)
@@ -470,6 +776,8 @@ class TherapeuticCLI:
     
     def _display_current_mode(self) -> None:
         """Display the current agent mode (power user feature)."""
+        from rich import box
+        from rich.panel import Panel
         from app.agents import AgentMode
         
         mode = self.migru_core.get_current_mode()
@@ -514,49 +822,37 @@ class TherapeuticCLI:
     
     def _display_available_models(self) -> None:
         """Display available AI models."""
-        models_table = Table(
-            show_header=True,
-            box=box.ROUNDED,
-            title="[bold cyan]🤖 Available AI Models[/bold cyan]",
-            title_style="bold cyan"
-        )
-        models_table.add_column("Model", style="cyan", no_wrap=True)
-        models_table.add_column("Provider", style="white")
-        models_table.add_column("Speed", style="yellow")
-        models_table.add_column("Intelligence", style="magenta")
-        
-        # Define available models
-        models = [
-            ("mistral-creative", "Mistral AI", "⚡⚡⚡", "🧠🧠🧠🧠"),
-            ("mistral-small", "Mistral AI", "⚡⚡⚡", "🧠🧠🧠"),
-            ("mistral-medium", "Mistral AI", "⚡⚡", "🧠🧠🧠🧠"),
-            ("mistral-large", "Mistral AI", "⚡⚡", "🧠🧠🧠🧠🧠"),
-            ("cerebras", "Cerebras", "⚡⚡⚡⚡⚡", "🧠🧠"),
-            ("openai-gpt4", "OpenAI", "⚡⚡", "🧠🧠🧠🧠🧠"),
-        ]
-        
-        for model, provider, speed, intel in models:
-            models_table.add_row(model, provider, speed, intel)
+        from app.cli import model_catalog
+
+        # Serve the cached catalog now; revalidate in the background if stale
+        # (never in local privacy mode, which makes no external calls)
+        fetched_at, entries = model_catalog.load_catalog()
+        if model_catalog.is_stale(fetched_at) and model_catalog.refresh_allowed():
+            self._schedule_models_refresh()
         
         self.console.print()
-        self.console.print(models_table)
+        self.console.print(_models_table(entries))
         self.console.print()
         self.console.print("[dim]Usage: /model <name> (e.g., /model cerebras)[/dim]")
         self.console.print("[dim]Current configuration in config.py[/dim]")
     
+    def _schedule_models_refresh(self) -> None:
+        """Start a background model catalog refresh unless one is running."""
+        from app.cli import model_catalog
+
+        if self._models_refresh is not None and not self._models_refresh.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Not inside the chat loop; keep serving the stale catalog
+        self._models_refresh = loop.create_task(
+            model_catalog.refresh_catalog(_resolve_model_alias)
+        )
+    
     def _switch_model(self, model_name: str) -> None:
         """Switch AI model dynamically."""
-        model_map = {
-            "mistral-creative": config.MODEL_MISTRAL_CREATIVE,
-            "mistral-small": config.MODEL_MISTRAL_SMALL,
-            "mistral-medium": config.MODEL_MISTRAL_MEDIUM,
-            "mistral-large": config.MODEL_MISTRAL_LARGE,
-            "cerebras": config.MODEL_FAST,
-            "openai": "openai:gpt-4o",
-            "openai-gpt4": "openai:gpt-4o",
-        }
-        
-        model = model_map.get(model_name.lower())
+        model = _resolve_model_alias(model_name)
         if model:
             # Update the agents with new model
             from app.agents import AgentMode
@@ -570,8 +866,6 @@ class TherapeuticCLI:
             self.console.print("[yellow]Note: Model switching takes effect on next message[/yellow]")
             
             # Store preference for this session
-            if not hasattr(self, '_preferred_model'):
-                self._preferred_model = {}
             self._preferred_model[current_mode] = model
         else:
             self.console.print(f"[yellow]Unknown model: {model_name}[/yellow]")
@@ -605,9 +899,11 @@ class TherapeuticCLI:
 
     def _display_stats(self) -> None:
         """Display session statistics (power user feature)."""
-        duration = datetime.now() - self.session_start
-        minutes = int(duration.total_seconds() / 60)
-        seconds = int(duration.total_seconds() % 60)
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+
+        minutes, seconds = self._elapsed()
         
         stats = Table(show_header=False, box=box.SIMPLE)
         stats.add_column("Metric", style="cyan")
@@ -615,7 +911,12 @@ class TherapeuticCLI:
         
         stats.add_row("Session Duration", f"{minutes}m {seconds}s")
         stats.add_row("Messages Exchanged", str(self.conversation_count))
-        stats.add_row("Current Mode", self.migru_core.get_current_mode().value.title())
+        # Don't load the core just to report its mode
+        if self._migru_core is None:
+            mode_str = "Not loaded"
+        else:
+            mode_str = self._migru_core.get_current_mode().value.title()
+        stats.add_row("Current Mode", mode_str)
         
         panel = Panel(
             stats,
@@ -626,10 +927,13 @@ class TherapeuticCLI:
         
         self.console.print(panel)
     
-    def _guided_breathing(self) -> None:
+    async def _guided_breathing(self) -> None:
         """Interactive guided breathing exercise."""
-        import time
-        
+        from rich import box
+        from rich.align import Align
+        from rich.live import Live
+        from rich.panel import Panel
+
         self.console.print()
         self.console.print(Panel(
             Align.center(
@@ -641,34 +945,26 @@ class TherapeuticCLI:
             box=box.ROUNDED
         ))
         
-        input()  # Wait for user
+        await asyncio.to_thread(input)  # Wait for user
         
         self.console.print()
         
-        # 4-7-8 breathing pattern (calming)
+        # 4-7-8 breathing pattern (calming), redrawn in place. Frames are
+        # derived from one perf_counter start, so phase timing doesn't drift
+        # with tick latency; the display only changes when the frame does.
         cycles = 3
-        for cycle in range(cycles):
-            # Inhale
-            self.console.print(f"\n[bold cyan]Cycle {cycle + 1}/{cycles}[/bold cyan]")
-            self.console.print("[green]Breathe in slowly...[/green] [dim](4 seconds)[/dim]")
-            for i in range(4):
-                time.sleep(1)
-                self.console.print("  " + "●" * (i + 1))
-            
-            # Hold
-            self.console.print("[yellow]Hold gently...[/yellow] [dim](7 seconds)[/dim]")
-            for i in range(7):
-                time.sleep(1)
-                self.console.print("  " + "○" * (i + 1))
-            
-            # Exhale
-            self.console.print("[blue]Breathe out slowly...[/blue] [dim](8 seconds)[/dim]")
-            for i in range(8):
-                time.sleep(1)
-                self.console.print("  " + "~" * (i + 1))
-            
-            if cycle < cycles - 1:
-                time.sleep(1)
+        period = _BREATH_CYCLE_SECONDS + 1  # one second's pause between cycles
+        total = cycles * period - 1
+        start = time.perf_counter()
+        shown = None
+        with Live("", console=self.console, refresh_per_second=10) as live:
+            while (elapsed := time.perf_counter() - start) < total:
+                cycle, offset = divmod(elapsed, period)
+                frame = _breath_frame(int(cycle), offset, cycles)
+                if frame is not None and frame != shown:
+                    live.update(frame)
+                    shown = frame
+                await asyncio.sleep(0.1)
         
         self.console.print()
         self.console.print(Panel(
@@ -683,26 +979,14 @@ class TherapeuticCLI:
     
     def _quick_relief_menu(self) -> None:
         """Display quick relief options."""
-        relief_table = Table(
-            show_header=False,
-            box=box.ROUNDED,
-            title="[bold green]🌿 Quick Relief Options[/bold green]"
-        )
-        relief_table.add_column("Action", style="green", no_wrap=True)
-        relief_table.add_column("Description", style="white")
-        
-        relief_table.add_row("🫁 /breathe", "Guided breathing exercise (3 min)")
-        relief_table.add_row("🌊 /patterns", "View your wellness patterns")
-        relief_table.add_row("💭 Ask me", "Share what you're feeling")
-        relief_table.add_row("🔍 /research", "Find relief techniques")
-        
-        self.console.print()
-        self.console.print(relief_table)
-        self.console.print()
-        self.console.print("[dim]Or just tell me what you need...[/dim]")
+        self._print_static(_relief_screen)
     
     def _show_session_insights(self) -> None:
         """Show insights gathered during this session."""
+        from rich import box
+        from rich.console import Group
+        from rich.panel import Panel
+
         if self.conversation_count < 3:
             self.console.print(Panel(
                 "[dim]Keep talking with me to discover insights...\n\n"
@@ -722,7 +1006,7 @@ class TherapeuticCLI:
         if self.conversation_count >= 10:
             insights.append("Your openness to understanding is remarkable")
         
-        duration_mins = int((datetime.now() - self.session_start).total_seconds() / 60)
+        duration_mins, _ = self._elapsed()
         if duration_mins >= 10:
             insights.append(f"We've spent {duration_mins} minutes together—that's meaningful")
         
@@ -737,22 +1021,22 @@ class TherapeuticCLI:
         
         content.append("\n[dim]These observations help me support you better[/dim]")
         
-        self.console.print()
-        self.console.print(Panel(
+        self.console.print(Group("", Panel(
             "\n".join(content),
             border_style="cyan",
             box=box.ROUNDED
-        ))
-        
-
+        )))
     
-    def _display_response(self, response: Any, title: str = "Migru", subtitle: str = "companion") -> None:
-        """Display response."""
+    def _display_response(self, response: Any, title: str = "Migru", subtitle: str = "companion") -> str:
+        """Display response and return its full text."""
+        from rich.markdown import Markdown
+
         self.console.print()
         
-        # Print header
-        self.console.print(f"[bold magenta]🌸 {title}[/bold magenta] [dim]({subtitle})[/dim]")
-        self.console.print("─" * 60)
+        # Print header (styled spans, so title/subtitle are never parsed as markup)
+        header = Text.assemble(("🌸 " + title, _STYLE_TITLE), " ", (f"({subtitle})", _STYLE_DIM))
+        self.console.print(header)
+        self.console.print(_HR_TEXT)
         
         content = ""
         
@@ -760,23 +1044,16 @@ class TherapeuticCLI:
         from types import GeneratorType
         
         if isinstance(response, GeneratorType):
-            # Stream directly to terminal (no Live lock - allows scrolling and copy/paste)
-            for chunk in response:
-                chunk_text = ""
-                
-                if hasattr(chunk, "content") and chunk.content:
-                    chunk_text = chunk.content
-                elif isinstance(chunk, str):
-                    chunk_text = chunk
-                
-                if chunk_text:
-                    content += chunk_text
-                    # Print chunk immediately (no buffering, allows interaction)
-                    self.console.print(chunk_text, end="", markup=False)
-            
-            # Print newline after streaming completes
-            self.console.print()
+            # migru_core streams reply text, written out as it arrives
+            if config.STREAM_MARKDOWN:
+                content = self._stream_markdown(response)
+            else:
+                content = self._stream_plain(response)
         
+        elif isinstance(response, str):
+            # Plain reply text (e.g. served from the LLM cache)
+            content = response
+            self.console.print(Markdown(content))
         elif hasattr(response, 'content'):
             # Non-streaming response
             content = response.content
@@ -787,21 +1064,78 @@ class TherapeuticCLI:
             self.console.print(content)
         
         # Print footer
-        self.console.print("─" * 60)
+        self.console.print(_HR_TEXT)
         self.console.print()
+        return content
+    
+    def _stream_plain(self, texts: Iterable[str]) -> str:
+        """Stream raw text to the terminal and return the full content."""
+        # Stream directly to terminal (no Live lock - allows scrolling and copy/paste).
+        # Chunks are plain text, so they bypass Rich and are coalesced until a
+        # newline or STREAM_FLUSH_INTERVAL passes.
+        out = sys.stdout.write
+        flush = sys.stdout.flush
+        monotonic = time.monotonic
+        parts = []
+        buf = []
+        last_flush = monotonic()
+        
+        try:
+            for chunk_text in texts:
+                parts.append(chunk_text)
+                buf.append(chunk_text)
+                now = monotonic()
+                if "\n" in chunk_text or now - last_flush > STREAM_FLUSH_INTERVAL:
+                    out("".join(buf))
+                    flush()
+                    buf.clear()
+                    last_flush = now
+        finally:
+            if buf:
+                out("".join(buf))
+                flush()
+            # Print newline after streaming completes, which also puts Rich
+            # back in charge of the cursor
+            self.console.print()
+        return "".join(parts)
     
-    def run(self) -> None:
+    def _stream_markdown(self, texts: Iterable[str]) -> str:
+        """Render streamed text as Markdown, one paragraph at a time."""
+        from rich.markdown import Markdown
+
+        parts = []
+        pending = []
+        
+        for chunk_text in texts:
+            parts.append(chunk_text)
+            pending.append(chunk_text)
+            if "\n" not in chunk_text:
+                continue
+            
+            # Flush every completed paragraph, unless that would split a code fence
+            done, sep, rest = "".join(pending).rpartition("\n\n")
+            if sep and done.strip() and done.count("```") % 2 == 0:
+                self.console.print(Markdown(done))
+                pending = [rest]
+        
+        tail = "".join(pending).strip()
+        if tail:
+            self.console.print(Markdown(tail))
+        return "".join(parts)
+    
+    async def run(self) -> None:
         """Main conversation loop."""
         self.display_welcome()
         
         # Create prompt session
         session = self.create_prompt_session()
+        is_exit = _exit_matcher()
         
         try:
             while True:
                 # Get user input with dynamic prompt
                 try:
-                    user_input = session.prompt(self.get_dynamic_prompt())
+                    user_input = await session.prompt_async(self.get_dynamic_prompt())
                 except KeyboardInterrupt:
                     user_input = "/exit"
                 
@@ -810,15 +1144,13 @@ class TherapeuticCLI:
                     continue
                 
                 # Check for exit words (bye, goodbye, etc.)
-                exit_words = ["bye", "goodbye", "farewell", "see you", "gotta go", "have to go"]
-                user_lower = user_input.lower().strip()
-                if any(word in user_lower for word in exit_words):
+                if is_exit(user_input):
                     self._display_farewell()
                     break
                 
                 # Handle commands
                 if user_input.startswith('/'):
-                    result = self.handle_command(user_input)
+                    result = await self.handle_command(user_input)
                     if result is True:
                         break  # Exit
                     elif result is False:
@@ -826,76 +1158,176 @@ class TherapeuticCLI:
                 
                 # Process message through Migru
                 try:
-                    # Detect mood and update context
-                    context_manager = self.get_service("context_manager")
-                    if context_manager:
-                        mood = context_manager.detect_mood(user_input)
-                        if mood:
-                            context_manager.update_user_state(self.user_name, detected_mood=mood)
+                    if not self._turn_services_ready:
+                        self._load_turn_services()
                     
-                    # Track patterns (non-blocking)
-                    pattern_detector = self.get_service("pattern_detector")
-                    if pattern_detector:
+                    # Detect mood and update context alongside the model call
+                    mood = None
+                    mood_task = None
+                    if self._ctx_mgr:
+                        mood_task = asyncio.create_task(
+                            asyncio.to_thread(self._note_mood, user_input)
+                        )
+                    
+                    brief = len(user_input.strip()) < _MIN_SIGNAL_CHARS
+                    
+                    # Track patterns off the critical path; drop when backed up
+                    if self._event_q is not None and not brief:
                         try:
-                            pattern_detector.record_event(
-                                user_id=self.user_name,
-                                event_type="message",
-                                content=user_input,
-                                metadata={"hour": datetime.now().hour}
-                            )
-                        except Exception as e:
-                            logger.debug(f"Pattern tracking failed: {e}")
+                            self._event_q.put_nowait({
+                                "user_id": self.user_name,
+                                "event_type": "message",
+                                "content": user_input,
+                                "metadata": {"hour": _current_hour()},
+                                "timestamp": time.time(),
+                            })
+                        except queue.Full:
+                            logger.debug("Pattern event queue full; dropping event")
                     
                     # Get response from Migru (COMPLETELY suppress all logs/warnings)
-                    import logging
-                    import warnings
-                    import sys
-                    import os
+                    with _silenced():
+                        core = await self.migru_core
                     
-                    # Save stderr
-                    old_stderr = sys.stderr
+                    # Replies to mood-neutral prompts are cached; mood-dependent
+                    # replies aren't reproducible, and brief messages make
+                    # ambiguous keys. Mood follows from the prompt text, so an
+                    # exact lookup can't hit a mood prompt and needn't wait for it.
+                    # Both caches are scoped to the mode this message will be
+                    # routed to and to the session, whose history replies depend on.
+                    routed_mode = core._route_query(user_input).value
+                    cache_key = None
+                    response = None
+                    if config.LLM_CACHE_ENABLED and not brief:
+                        from app import llm_cache
+                        
+                        cache_key = llm_cache.make_key(
+                            routed_mode, self.user_name, self._session_id, user_input
+                        )
+                        response = llm_cache.get(cache_key)
                     
-                    try:
-                        # NUCLEAR OPTION: Suppress everything
-                        sys.stderr = open(os.devnull, 'w')
-                        warnings.filterwarnings("ignore")
-                        logging.disable(logging.CRITICAL)
+                    # Paraphrases of recent prompts can reuse their reply too,
+                    # but a paraphrase may carry a mood the original didn't.
+                    semantic = response is None and config.SEMANTIC_CACHE_ENABLED
+                    if semantic and mood_task is not None:
+                        mood = await mood_task
+                        mood_task = None
+                        semantic = not mood
+                    if semantic:
+                        from app import semantic_cache
                         
-                        response = self.migru_core.run(
+                        response = await asyncio.to_thread(
+                            semantic_cache.lookup,
+                            self.user_name,
+                            routed_mode,
+                            self._session_id,
                             user_input,
-                            stream=config.STREAMING,
-                            user_id=self.user_name
                         )
-                        
-                    finally:
-                        # Restore stderr and logging
-                        sys.stderr = old_stderr
-                        logging.disable(logging.NOTSET)
                     
-                    # Display response (after restoring output)
-                    mode = self.migru_core.get_current_mode()
-                    self._display_response(response, "Migru", mode.value)
+                    fresh = response is None  # store only fresh replies
+                    if fresh:
+                        with _silenced():
+                            response = await core.run(
+                                user_input,
+                                stream=config.STREAMING,
+                                user_id=self.user_name,
+                                session_id=self._session_id,
+                            )
+                        # Fallback messages arrive as plain strings; never cache them
+                        fresh = not isinstance(response, str)
+                    
+                    # Display response (after restoring output); streamed
+                    # replies are written as they arrive and collected for the caches
+                    mode = core.get_current_mode()
+                    content = self._display_response(response, "Migru", mode.value)
+                    if mood_task is not None:
+                        mood = await mood_task
+                    if fresh and content and not mood:
+                        if cache_key is not None:
+                            llm_cache.set(cache_key, content)
+                        if semantic:
+                            await asyncio.to_thread(
+                                semantic_cache.store,
+                                self.user_name,
+                                routed_mode,
+                                self._session_id,
+                                user_input,
+                                content,
+                            )
                     
                     self.conversation_count += 1
-                
                 except Exception as e:
                     logger.error(f"Error processing message: {e}", exc_info=True)
                     self.console.print()
-                    self.console.print(Panel(
-                        "[yellow]I'm having a moment of difficulty[/yellow]\n\n"
-                        "[white]Let's try that again, or rephrase if needed[/white]\n\n"
-                        "[dim]Your message is important to me 🌸[/dim]",
-                        border_style="yellow",
-                        box=box.ROUNDED
-                    ))
+                    self._print_static(_error_panel)
         
         except Exception as e:
             logger.error(f"Fatal error in conversation loop: {e}", exc_info=True)
             self.console.print(f"\n[red]Session error: {e}[/red]\n")
+        
+        finally:
+            # Let buffered pattern events reach storage before we exit
+            self._flush_events()
+    
+    def _load_turn_services(self) -> None:
+        """Resolve the per-turn services for the rest of the session.
+
+        Deferred to the first chat message: importing them takes about half
+        a second, which would otherwise delay the first prompt and be wasted
+        on sessions that only run commands.
+        """
+        self._turn_services_ready = True
+        self._ctx_mgr = self.get_service("context_manager")
+        self._pattern = self.get_service("pattern_detector")
+        if self._pattern:
+            self._event_q = queue.Queue(maxsize=1024)
+            threading.Thread(target=self._drain_events, name="migru-events", daemon=True).start()
+    
+    def _note_mood(self, user_input: str) -> Optional[str]:
+        """Detect the message's mood and record it on the user's state."""
+        try:
+            mood = self._ctx_mgr.detect_mood(user_input)
+            if mood:
+                self._ctx_mgr.update_user_state(self.user_name, detected_mood=mood)
+            return mood
+        except Exception as e:
+            logger.debug("Mood tracking failed: %s", e)
+            return None
+    
+    def _drain_events(self) -> None:
+        """Record queued pattern events in batches; runs on a daemon thread.
+
+        Events are written once _EVENT_BATCH_SIZE have accumulated, or when a
+        None marker from _flush_events arrives.
+        """
+        pending = []
+        while True:
+            event = self._event_q.get()
+            if event is not None:
+                pending.append(event)
+                if len(pending) < _EVENT_BATCH_SIZE:
+                    continue
+            try:
+                if pending:
+                    self._pattern.record_events(pending)
+            except Exception as e:
+                logger.debug("Pattern tracking failed: %s", e)
+            finally:
+                for _ in range(len(pending) + (event is None)):
+                    self._event_q.task_done()
+                pending = []
+    
+    def _flush_events(self) -> None:
+        """Write buffered pattern events now and wait until they're stored."""
+        if self._event_q is not None:
+            self._event_q.put(None)
+            self._event_q.join()
 
 
-def setup_environment() -> bool:
+def setup_environment(verbose: bool = False) -> bool:
     """Setup and validate environment."""
+    from rich import box
+    from rich.panel import Panel
+
     try:
         config.validate()
         logger.info("Configuration validated")
@@ -908,9 +1340,10 @@ def setup_environment() -> bool:
             "CEREBRAS_API_KEY": config.CEREBRAS_API_KEY,
         }
         
-        for key, value in env_vars.items():
-            if value:
-                os.environ[key] = value
+        os.environ.update({key: value for key, value in env_vars.items() if value})
+        
+        if not verbose:
+            quiet_loggers(_AGENT_RUN_LOGGERS)
         
         return True
     
@@ -930,6 +1363,16 @@ def version_callback(value: bool):
         print("Migru 2.0.0")
         raise typer.Exit()
 
+def _start_chat(user: str) -> None:
+    """Run one chat session; shared by ``migru chat`` and bare ``migru``."""
+    try:
+        asyncio.run(TherapeuticCLI(user_name=user).run())
+    except KeyboardInterrupt:
+        console.print("\n[dim]Session interrupted. Take care! 🌸[/dim]\n")
+
+# Subcommands that need neither API configuration nor Redis
+_OFFLINE_COMMANDS = frozenset({"breathe"})
+
 app = typer.Typer(
     name="migru",
     help="Migru - AI companion for migraine and stress relief",
@@ -941,11 +1384,7 @@ def chat(
     user: str = typer.Option("Friend", "--user", "-u", help="Your name"),
 ):
     """Start an interactive therapeutic chat session."""
-    try:
-        cli = TherapeuticCLI(user_name=user)
-        cli.run()
-    except KeyboardInterrupt:
-        console.print("\n[dim]Session interrupted. Take care! 🌸[/dim]\n")
+    _start_chat(user)
 
 @app.command()
 def profile(
@@ -959,7 +1398,7 @@ def profile(
 def breathe():
     """Start a guided breathing exercise."""
     cli = TherapeuticCLI()
-    cli._guided_breathing()
+    asyncio.run(cli._guided_breathing())
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -977,28 +1416,24 @@ def main(
         logging.getLogger("migru").setLevel(logging.INFO)
     else:
         import logging
-        logging.basicConfig(level=logging.CRITICAL)
         suppress_verbose_logging()
         logging.getLogger().setLevel(logging.CRITICAL)
-        import warnings
-        warnings.filterwarnings("ignore")
     
-    # Setup environment
-    if not setup_environment():
-        raise typer.Exit(code=1)
+    # The breathing exercise runs offline; don't make it wait on config or Redis
+    if ctx.invoked_subcommand not in _OFFLINE_COMMANDS:
+        # Setup environment
+        if not setup_environment(verbose):
+            raise typer.Exit(code=1)
 
-    # Ensure Redis is available
-    from app.db import ensure_redis_running
-    if not ensure_redis_running():
-        logger.debug("Redis not available, memory features limited")
+        # Ensure Redis is available
+        from app.db import ensure_redis_running
+        if not ensure_redis_running():
+            logger.debug("Redis not available, memory features limited")
 
     if ctx.invoked_subcommand is None:
         # Launch default chat
         try:
-            cli = TherapeuticCLI(user_name=user)
-            cli.run()
-        except KeyboardInterrupt:
-            console.print("\n[dim]Session interrupted. Take care! 🌸[/dim]\n")
+            _start_chat(user)
         except Exception as e:
             logger.error(f"Fatal error: {e}", exc_info=True)
             console.print(f"\n[red]Error: {e}[/red]\n")
@@ -47,12 +47,18 @@ class LocalLlamaModel(OpenAILike):
             top_p: Nucleus sampling parameter
             repeat_penalty: Penalty for repetition
         """
+        # llama.cpp keeps the KV cache of the last prompt in its slot and only
+        # prefills the new suffix when the next prompt shares the prefix, as
+        # consecutive turns of one session do. Ollama does this on its own.
+        extra_body = {"cache_prompt": True, **(kwargs.pop("extra_body", None) or {})}
+
         super().__init__(
             id=model,
             api_key=api_key,
             base_url=f"{host}/v1",
             temperature=temperature,
             max_tokens=max_tokens,
+            extra_body=extra_body,
             **kwargs,
         )
 
@@ -7,6 +7,7 @@ This module handles:
 - Intelligent information extraction without being intrusive
 """
 
+import time
 from datetime import datetime
 from textwrap import dedent
 from typing import Any
@@ -17,6 +18,19 @@ from app.logger import get_logger
 
 logger = get_logger("migru.personalization")
 
+# A profile read from Redis is reused for this many seconds
+PROFILE_CACHE_TTL = 30.0
+
+
+def _merge_into(target: dict[str, Any], updates: dict[str, Any]) -> None:
+    """Recursively merge ``updates`` into ``target``; non-dict values overwrite."""
+    for key, value in updates.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge_into(current, value)
+        else:
+            target[key] = value
+
 
 class UserProfile:
     """Structured user profile for deep personalization."""
@@ -25,47 +39,47 @@ class UserProfile:
         self.user_id = user_id
         self.db = db
         self.profile_key = f"user_profile:{user_id}"
+        # Raw JSON from the last read or write, and when it was taken
+        self._cached_data: Any = None
+        self._cached_at: float | None = None
 
     def get_profile(self) -> dict[str, Any]:
-        """Get complete user profile."""
+        """Get complete user profile (a fresh dict; callers may mutate it)."""
         try:
-            # Get Redis client from Agno DB
             import json
             from typing import cast
 
-            from redis import Redis
-
-            from app.config import config
+            if self._cached_at is None or time.monotonic() - self._cached_at > PROFILE_CACHE_TTL:
+                from app.db import get_redis_client
 
-            redis_client = Redis.from_url(config.REDIS_URL)
-            profile_data = redis_client.get(self.profile_key)
-
-            if profile_data is not None:
+                profile_data = get_redis_client().get(self.profile_key)
                 if hasattr(profile_data, "__await__"):
                     # This shouldn't happen with sync client but satisfying mypy
                     logger.warning("Detected awaitable in sync redis call")
                     return self._default_profile()
-                return cast(dict[str, Any], json.loads(cast(str, profile_data)))
+                self._cached_data, self._cached_at = profile_data, time.monotonic()
+
+            if self._cached_data is not None:
+                return cast(dict[str, Any], json.loads(cast(str, self._cached_data)))
             return self._default_profile()
         except Exception as e:
             logger.debug(f"Error loading profile (using default): {e}")
             return self._default_profile()
 
     def update_profile(self, updates: dict[str, Any]) -> bool:
-        """Update specific profile fields."""
+        """Update specific profile fields; nested sections are merged, not replaced."""
         try:
             import json
 
-            from redis import Redis
-
-            from app.config import config
+            from app.db import get_redis_client
 
-            redis_client = Redis.from_url(config.REDIS_URL)
             profile = self.get_profile()
-            profile.update(updates)
+            _merge_into(profile, updates)
             profile["last_updated"] = datetime.now().isoformat()
 
-            redis_client.set(self.profile_key, json.dumps(profile))
+            data = json.dumps(profile)
+            get_redis_client().set(self.profile_key, data)
+            self._cached_data, self._cached_at = data, time.monotonic()
             logger.debug(f"Updated profile for {self.user_id}")
             return True
         except Exception as e:
@@ -156,10 +170,14 @@ class PersonalizationEngine:
 
     def __init__(self, db: RedisDb) -> None:
         self.db = db
+        self._profiles: dict[str, UserProfile] = {}
 
     def get_user_profile(self, user_id: str) -> UserProfile:
-        """Get or create user profile."""
-        return UserProfile(user_id, self.db)
+        """Get or create user profile (one instance per user, sharing its cache)."""
+        profile = self._profiles.get(user_id)
+        if profile is None:
+            profile = self._profiles[user_id] = UserProfile(user_id, self.db)
+        return profile
 
     def generate_curiosity_prompts(self, profile: dict[str, Any]) -> list[str]:
         """
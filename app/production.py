@@ -10,6 +10,7 @@ This module provides:
 
 import os
 import sys
+import time
 from typing import Any
 from typing import cast
 
@@ -17,6 +18,10 @@ from app.logger import get_logger
 
 logger = get_logger("migru.production")
 
+# A Redis health result is reused for this many seconds
+REDIS_HEALTH_TTL = 5.0
+_redis_health: tuple[float, dict[str, Any]] = (float("-inf"), {})
+
 
 class ProductionValidator:
     """Validates production readiness and security."""
@@ -191,24 +196,30 @@ class HealthCheck:
 
     @staticmethod
     def check_redis() -> dict[str, Any]:
-        """Check Redis connectivity and health."""
-        try:
-            from redis import Redis
+        """Check Redis connectivity and health (cached for REDIS_HEALTH_TTL)."""
+        global _redis_health
+        checked_at, status = _redis_health
+        if time.monotonic() - checked_at <= REDIS_HEALTH_TTL:
+            return status
 
-            from app.config import config
+        try:
+            from app.db import get_redis_client
 
-            client = Redis.from_url(config.REDIS_URL)
+            client = get_redis_client()
             client.ping()
 
             info = cast(Any, client.info())
-            return {
+            status = {
                 "connected": True,
                 "memory_used_mb": info.get("used_memory", 0) / 1024 / 1024,
                 "total_connections": info.get("total_connections_received", 0),
             }
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
-            return {"connected": False, "error": str(e)}
+            status = {"connected": False, "error": str(e)}
+
+        _redis_health = (time.monotonic(), status)
+        return status
 
     @staticmethod
     def check_api_keys() -> dict[str, bool]:
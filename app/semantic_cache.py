@@ -0,0 +1,148 @@
+"""
+Semantic reply cache for paraphrased prompts.
+
+Prompts are embedded with a small sentence-transformers model and kept with
+their replies in a RediSearch vector index for SEMANTIC_CACHE_TTL. A KNN-1 hit
+for the same user, routed mode and session at cosine similarity >=
+config.SEMANTIC_CACHE_THRESHOLD reuses the stored reply, matching the scope of
+the exact cache in app.llm_cache. Needs the optional ``semantic`` extra and Redis Stack; without
+either, lookups simply miss.
+"""
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional
+
+from app.config import config
+from app.db import get_redis_client
+from app.logger import get_logger
+
+logger = get_logger("migru.semantic_cache")
+
+INDEX_NAME = "idx:semantic_cache:v2"  # v2 adds the mode and session tags
+KEY_PREFIX = "memory:"
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+SEMANTIC_CACHE_TTL = 15 * 60  # seconds
+MIN_WORDS = 4
+
+_TAG_SPECIAL = re.compile(r"([^\w])")
+
+
+@lru_cache(maxsize=1)
+def _model():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(MODEL_NAME)
+
+
+@lru_cache(maxsize=1)
+def _ensure_index() -> bool:
+    """Create the vector index if needed; False when the cache can't run here."""
+    try:
+        from redis.commands.search.field import TagField, TextField, VectorField
+        from redis.exceptions import ResponseError
+
+        try:
+            from redis.commands.search.index_definition import IndexDefinition, IndexType
+        except ImportError:  # redis < 6
+            from redis.commands.search.indexDefinition import IndexDefinition, IndexType
+
+        _model()
+        search = get_redis_client().ft(INDEX_NAME)
+        try:
+            search.info()
+        except ResponseError:
+            search.create_index(
+                [
+                    TagField("user"),
+                    TagField("mode"),
+                    TagField("session"),
+                    TextField("reply"),
+                    VectorField(
+                        "embedding",
+                        "HNSW",
+                        {"TYPE": "FLOAT32", "DIM": EMBEDDING_DIM, "DISTANCE_METRIC": "COSINE"},
+                    ),
+                ],
+                definition=IndexDefinition(prefix=[KEY_PREFIX], index_type=IndexType.HASH),
+            )
+        return True
+    except Exception as e:
+        logger.debug("Semantic cache unavailable: %s", e)
+        return False
+
+
+@lru_cache(maxsize=8)
+def _embed(prompt: str) -> bytes:
+    """FLOAT32 bytes of the normalised prompt embedding (lookup and store share it)."""
+    import numpy as np
+
+    vector = _model().encode(prompt.strip().lower(), normalize_embeddings=True)
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def is_eligible(prompt: str) -> bool:
+    """Commands and very short inputs are too ambiguous to match semantically."""
+    return not prompt.startswith("/") and len(prompt.split()) >= MIN_WORDS
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _tag(value: str) -> str:
+    return _TAG_SPECIAL.sub(r"\\\1", value)
+
+
+def lookup(user_id: str, mode: str, session_id: str, prompt: str) -> Optional[str]:
+    """Return a cached reply to a near-identical earlier prompt in the same mode and session."""
+    if not (config.SEMANTIC_CACHE_ENABLED and is_eligible(prompt) and _ensure_index()):
+        return None
+
+    from redis.commands.search.query import Query
+
+    filters = f"@user:{{{_tag(user_id)}}} @mode:{{{_tag(mode)}}} @session:{{{_tag(session_id)}}}"
+    query = (
+        Query(f"({filters})=>[KNN 1 @embedding $vec AS distance]")
+        .return_fields("reply", "distance")
+        .dialect(2)
+    )
+    try:
+        result = get_redis_client().ft(INDEX_NAME).search(
+            query, query_params={"vec": _embed(prompt)}
+        )
+    except Exception as e:
+        logger.debug("Semantic cache lookup failed: %s", e)
+        return None
+
+    if not result.docs:
+        return None
+    doc = result.docs[0]
+    # COSINE distance is 1 - similarity
+    if 1.0 - float(_decode(doc.distance)) < config.SEMANTIC_CACHE_THRESHOLD:
+        return None
+    return _decode(doc.reply)
+
+
+def store(user_id: str, mode: str, session_id: str, prompt: str, reply: str) -> None:
+    """Remember ``reply`` for ``prompt`` so paraphrases in the same mode and session can reuse it."""
+    if not (config.SEMANTIC_CACHE_ENABLED and is_eligible(prompt) and reply and _ensure_index()):
+        return
+
+    raw = f"{mode}|{session_id}|{prompt.strip().lower()}"
+    key = f"{KEY_PREFIX}{user_id}:{hashlib.sha256(raw.encode()).hexdigest()}"
+    mapping = {
+        "user": user_id,
+        "mode": mode,
+        "session": session_id,
+        "reply": reply,
+        "embedding": _embed(prompt),
+    }
+    try:
+        pipeline = get_redis_client().pipeline()
+        pipeline.hset(key, mapping=mapping)
+        pipeline.expire(key, SEMANTIC_CACHE_TTL)
+        pipeline.execute()
+    except Exception as e:
+        logger.debug("Semantic cache store failed: %s", e)
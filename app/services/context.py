@@ -1,10 +1,53 @@
 from textwrap import dedent
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+from app.config import config
 from app.services.knowledge import knowledge_service
 
 
+# High-intensity patterns trigger an immediate response; checked first, in order
+HIGH_INTENSITY_PATTERNS = {
+    "anxious": ["panick", "can't breath", "heart rac", "overwhelm", "can't focus"],
+    "frustrated": ["so frustrat", "can't take", "driving me crazy", "pissed"],
+    "stressed": ["so much stress", "can't handle", "breaking point", "too much"],
+}
+
+# Regular keywords; the mood with the most matching keywords wins
+MOOD_KEYWORDS = {
+    "stressed": ["stressed", "overwhelmed", "pressure", "busy", "deadline", "swamped"],
+    "anxious": ["anxious", "scared", "nervous", "panic", "worry", "uneasy"],
+    "tired": ["tired", "exhausted", "sleepy", "drained", "fatigue", "burnout"],
+    "frustrated": ["angry", "frustrated", "annoyed", "mad", "upset", "irritated"],
+    "happy": ["happy", "good", "great", "excited", "relief", "wonderful"],
+}
+
+# Moods that switch the tone straight away instead of easing into it
+_IMMEDIATE_MOODS = frozenset({"anxious", "frustrated", "overwhelmed"})
+_GROUNDING_MOODS = frozenset({"anxious", "stressed", "overwhelmed"})
+_ANCHOR_MOODS = frozenset({"stressed", "anxious"})
+_TECH_WORK_TYPES = frozenset({"remote", "office", "creative"})
+_TECH_HOBBIES = frozenset({"gaming", "coding", "tech"})
+
+
+@lru_cache(maxsize=1)
+def _mood_automaton():
+    """Aho-Corasick automaton over every mood keyword; None without pyahocorasick."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for tier, table in enumerate((HIGH_INTENSITY_PATTERNS, MOOD_KEYWORDS)):
+        for rank, (mood, keywords) in enumerate(table.items()):
+            for keyword in keywords:
+                automaton.add_word(keyword, (tier, rank, mood, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
 class AdaptiveContextService:
     """
     Advanced context manager with real-time adaptation capabilities.
@@ -40,7 +83,7 @@ class AdaptiveContextService:
         ]
 
         # Mood-specific lenses
-        if current_mood in ["stressed", "anxious"]:
+        if current_mood in _ANCHOR_MOODS:
             lenses.append(
                 ("The Anchor", "Be the steady harbor in the storm. Provide grounding, stability, and calm amid chaos. Focus on immediate relief techniques.")
             )
@@ -64,8 +107,8 @@ class AdaptiveContextService:
 
         is_tech_aligned = (
             life_phase == "student" or 
-            work_type in ["remote", "office", "creative"] or
-            any(h in ["gaming", "coding", "tech"] for h in hobbies)
+            work_type in _TECH_WORK_TYPES or
+            any(h in _TECH_HOBBIES for h in hobbies)
         )
 
         if is_tech_aligned:
@@ -98,37 +141,45 @@ class AdaptiveContextService:
         """
         text_lower = text.lower()
         
-        # High-intensity patterns (immediate response)
-        high_intensity_patterns = {
-            "anxious": [r"panick", r"can't breath", r"heart rac", r"overwhelm", r"can't focus"],
-            "frustrated": [r"so frustrat", r"can't take", r"driving me crazy", r"pissed"],
-            "stressed": [r"so much stress", r"can't handle", r"breaking point", r"too much"],
-        }
+        if config.FAST_MOOD_DETECT:
+            automaton = _mood_automaton()
+            if automaton is not None:
+                return self._detect_mood_automaton(automaton, text_lower)
         
         # Check high-intensity first for immediate response
-        for mood, patterns in high_intensity_patterns.items():
+        for mood, patterns in HIGH_INTENSITY_PATTERNS.items():
             for pattern in patterns:
                 if pattern in text_lower:
                     return mood
         
-        # Regular patterns
-        mood_keywords = {
-            "stressed": ["stressed", "overwhelmed", "pressure", "busy", "deadline", "swamped"],
-            "anxious": ["anxious", "scared", "nervous", "panic", "worry", "uneasy"],
-            "tired": ["tired", "exhausted", "sleepy", "drained", "fatigue", "burnout"],
-            "frustrated": ["angry", "frustrated", "annoyed", "mad", "upset", "irritated"],
-            "happy": ["happy", "good", "great", "excited", "relief", "wonderful"],
-        }
-        
         # Score moods based on keyword matches
         mood_scores = {}
-        for mood, keywords in mood_keywords.items():
+        for mood, keywords in MOOD_KEYWORDS.items():
             score = sum(1 for keyword in keywords if keyword in text_lower)
             if score > 0:
                 mood_scores[mood] = score
         
         return max(mood_scores, key=mood_scores.get) if mood_scores else None
 
+    @staticmethod
+    def _detect_mood_automaton(automaton, text_lower: str) -> Optional[str]:
+        """detect_mood in a single pass over the text; same result as the keyword loops."""
+        urgent = None
+        matched = {}
+        for _, (tier, rank, mood, keyword) in automaton.iter(text_lower):
+            if tier == 0:
+                if urgent is None or rank < urgent[0]:
+                    urgent = (rank, mood)
+            else:
+                matched.setdefault((rank, mood), set()).add(keyword)
+        
+        if urgent is not None:
+            return urgent[1]
+        if not matched:
+            return None
+        # Most distinct keywords wins; ties go to the earlier mood
+        return max(matched, key=lambda k: (len(matched[k]), -k[0]))[1]
+
     def update_user_state(
         self, user_id: str, detected_mood: str | None = None, new_trigger: str | None = None,
         energy_level: float = None, context_text: str = None
@@ -158,7 +209,7 @@ class AdaptiveContextService:
                 current_mood = current_state.get("mood", "neutral")
                 
                 # Immediate change for high-intensity moods
-                if detected_mood in ["anxious", "frustrated", "overwhelmed"]:
+                if detected_mood in _IMMEDIATE_MOODS:
                     if detected_mood != current_mood:
                         current_state["mood"] = detected_mood
                         current_state["mood_intensity"] = "high"
@@ -286,7 +337,7 @@ class AdaptiveContextService:
     def _get_adaptive_tone(self, mood: str, energy_level: float, intensity: str) -> str:
         """Get adaptive tone instructions based on current state."""
         if intensity == "high":
-            if mood in ["anxious", "stressed", "overwhelmed"]:
+            if mood in _GROUNDING_MOODS:
                 return ("ADAPTIVE TONE: Be immediately calming and grounding. "
                         "Use shorter sentences. Provide instant relief techniques. "
                         "Be a steady anchor in chaos.")
@@ -35,38 +35,59 @@ class PatternDetector:
         event_type: str,
         content: str,
         metadata: dict[str, Any] | None = None,
+        timestamp: float | None = None,
     ) -> None:
         """
         Record an event to the time-series stream.
 
         Uses Redis Streams and Pipelining for ultra-low latency.
         """
-        try:
-            timestamp = datetime.now().isoformat()
-            stream_key = f"wellness_stream:{user_id}"
-            event_data = {
-                "event_type": event_type,
-                "content": content,
-                "metadata": json.dumps(metadata or {}),
-                "timestamp": timestamp,
-            }
+        self.record_events([{
+            "user_id": user_id,
+            "event_type": event_type,
+            "content": content,
+            "metadata": metadata,
+            "timestamp": timestamp,
+        }])
+
+    def record_events(self, events: list[dict[str, Any]]) -> None:
+        """
+        Record a batch of events in one pipelined round-trip.
 
+        Each event is a dict of record_event's arguments; ``timestamp`` (epoch
+        seconds) defaults to now, so buffered events keep their own time.
+        """
+        try:
             # Use pipeline for atomic, single-round-trip execution
             pipeline = self.redis_client.pipeline()
 
-            # 1. Add to Redis stream (capped at 1000 events)
-            pipeline.xadd(stream_key, cast(dict[Any, Any], event_data), maxlen=1000)
+            for event in events:
+                user_id = event["user_id"]
+                event_type = event["event_type"]
+                metadata = event.get("metadata")
+                ts = event.get("timestamp")
+                event_data = {
+                    "event_type": event_type,
+                    "content": event["content"],
+                    "metadata": json.dumps(metadata or {}),
+                    "timestamp": (datetime.fromtimestamp(ts) if ts else datetime.now()).isoformat(),
+                }
+
+                # 1. Add to Redis stream (capped at 1000 events)
+                pipeline.xadd(
+                    f"wellness_stream:{user_id}", cast(dict[Any, Any], event_data), maxlen=1000
+                )
 
-            # 2. Update patterns atomically (no read-modify-write)
-            self._queue_pattern_updates(pipeline, user_id, event_type, metadata)
+                # 2. Update patterns atomically (no read-modify-write)
+                self._queue_pattern_updates(pipeline, user_id, event_type, metadata)
 
             # Execute all commands
             pipeline.execute()
             
-            self.logger.debug(f"Recorded {event_type} event for {user_id} (pipelined)")
+            self.logger.debug(f"Recorded {len(events)} event(s) (pipelined)")
 
         except Exception as e:
-            self.logger.debug(f"Error recording event: {e}")
+            self.logger.debug(f"Error recording events: {e}")
 
     def record_biometric(
         self,
@@ -5,6 +5,7 @@ This service analyzes conversations to extract meaningful patterns
 and insights about the user's life, preferences, and wellness journey.
 """
 
+import re
 from datetime import datetime
 from typing import Any
 from typing import cast
@@ -15,6 +16,28 @@ from app.personalization import PersonalizationEngine
 
 logger = get_logger("migru.insights")
 
+# Sensitivity key -> phrases that reveal it; scanned in one pass per message
+SENSITIVITY_PHRASES = {
+    # Weather sensitivity (Expanded based on research)
+    "weather_sensitive": ["weather affects", "barometric", "pressure changes", "storm coming", "rain triggers"],
+    # Light sensitivity (Expanded to include glare)
+    "light_sensitive": ["bright lights", "light sensitive", "dim lighting", "glare", "sunlight", "sun glare"],
+    "noise_sensitive": ["loud", "noise sensitive", "quiet space", "need silence"],
+    # Stress triggers
+    "deadlines": ["deadline"],
+    "crowds": ["crowds", "crowded"],
+    "conflict": ["conflict"],
+}
+STRESS_TRIGGERS = ("deadlines", "crowds", "conflict")
+
+_SENSITIVITY_RE = re.compile(
+    "|".join(
+        f"(?P<{key}>{'|'.join(map(re.escape, sorted(phrases, key=len, reverse=True)))})"
+        for key, phrases in SENSITIVITY_PHRASES.items()
+    ),
+    re.IGNORECASE,
+)
+
 
 class InsightExtractor:
     """Extract structured insights from natural conversation."""
@@ -195,29 +218,12 @@ class InsightExtractor:
 
     def _extract_sensitivities(self, message: str) -> dict[str, Any] | None:
         """Extract sensory sensitivities and triggers."""
-        message_lower = message.lower()
-        sensitivities: dict[str, Any] = {}
-
-        # Weather sensitivity (Expanded based on research)
-        if any(word in message_lower for word in ["weather affects", "barometric", "pressure changes", "storm coming", "rain triggers"]):
-            sensitivities["weather_sensitive"] = True
-
-        # Light sensitivity (Expanded to include glare)
-        if any(word in message_lower for word in ["bright lights", "light sensitive", "dim lighting", "glare", "sunlight", "sun glare"]):
-            sensitivities["light_sensitive"] = True
-
-        # Noise sensitivity
-        if any(word in message_lower for word in ["loud", "noise sensitive", "quiet space", "need silence"]):
-            sensitivities["noise_sensitive"] = True
-
-        # Stress triggers
-        triggers = []
-        if "deadline" in message_lower:
-            triggers.append("deadlines")
-        if any(word in message_lower for word in ["crowds", "crowded"]):
-            triggers.append("crowds")
-        if "conflict" in message_lower:
-            triggers.append("conflict")
+        found = {match.lastgroup for match in _SENSITIVITY_RE.finditer(message)}
+        sensitivities: dict[str, Any] = {
+            key: True for key in ("weather_sensitive", "light_sensitive", "noise_sensitive") if key in found
+        }
+
+        triggers = [trigger for trigger in STRESS_TRIGGERS if trigger in found]
         if triggers:
             sensitivities["stress_triggers"] = triggers
 
@@ -24,7 +24,9 @@ import threading
 from app.config import config
 from app.ui.theme import Layout, Themes
 
-console = Console()
+# Output is styled explicitly and emoji are literal, so skip the highlighter
+# and :shortcode: passes on every print
+console = Console(highlight=False, emoji=False)
 
 def get_theme():
     return config.UI.ACTIVE_THEME
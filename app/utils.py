@@ -1,4 +1,5 @@
 import functools
+import os
 import time
 from collections.abc import Callable
 from typing import Any
@@ -112,5 +113,17 @@ class PerformanceMonitor:
         return report
 
 
+class _NoopMonitor(PerformanceMonitor):
+    """Stand-in monitor when profiling is off: timer calls do nothing."""
+
+    def _noop(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    start_timer = end_timer = _noop  # type: ignore[assignment]
+
+
+# Opt-in profiling: MIGRU_PROFILE=1 enables the operation timers
+PROFILE_ENABLED = os.environ.get("MIGRU_PROFILE") == "1"
+
 # Global performance monitor instance
-performance_monitor = PerformanceMonitor()
+performance_monitor = PerformanceMonitor() if PROFILE_ENABLED else _NoopMonitor()
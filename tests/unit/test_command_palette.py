@@ -0,0 +1,37 @@
+"""Unit tests for the slash command completer."""
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from app.cli.command_palette import IntelligentCommandPalette
+
+
+@pytest.fixture
+def completer():
+    """Completer for the default command structure."""
+    return IntelligentCommandPalette().get_completer()
+
+
+def complete(completer, text):
+    """(text, start_position) of every completion offered for ``text``."""
+    return [(c.text, c.start_position) for c in completer.get_completions(Document(text), CompleteEvent())]
+
+
+class TestPrefixCompleter:
+    """Test prefix-table completion."""
+
+    def test_command_prefix_completes(self, completer):
+        """Test a partial command completes, ignoring case."""
+        assert complete(completer, "/HE") == [("/help", -3)]
+        assert complete(completer, "/mo") == [("/mode", -3), ("/model", -3)]
+
+    def test_argument_prefix_completes(self, completer):
+        """Test arguments complete after their command."""
+        assert complete(completer, "/mode co") == [("companion", -2)]
+        assert [text for text, _ in complete(completer, "/mode ")] == ["companion", "researcher", "advisor"]
+
+    @pytest.mark.parametrize("text", ["", "hello there", " /help", "/help ", "/mode companion "])
+    def test_nothing_to_complete(self, completer, text):
+        """Test chat text, argument-less commands and finished arguments offer nothing."""
+        assert complete(completer, text) == []
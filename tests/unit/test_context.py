@@ -0,0 +1,45 @@
+"""Unit tests for mood detection in the context service."""
+
+import pytest
+from unittest.mock import patch
+
+from app.services.context import AdaptiveContextService
+
+
+MESSAGES = [
+    "I'm so stressed and tired, deadline tomorrow",
+    "my heart racing, I'm anxious",
+    "tired, exhausted and drained but happy",
+    "feeling great",
+    "nothing in particular",
+    "I can't handle this, I'm panicking",
+]
+
+
+@pytest.fixture
+def service():
+    """Context service instance."""
+    return AdaptiveContextService()
+
+
+class TestDetectMood:
+    """Test keyword-based mood detection."""
+
+    def test_high_intensity_wins(self, service):
+        """Test high-intensity patterns take precedence over keyword counts."""
+        assert service.detect_mood("Too much pressure, so busy, swamped") == "stressed"
+        assert service.detect_mood("I'm panicking and so stressed") == "anxious"
+
+    def test_most_keywords_wins(self, service):
+        """Test the mood with the most distinct keywords is chosen."""
+        assert service.detect_mood("tired and drained, but happy") == "tired"
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_automaton_matches_keyword_scan(self, service, message):
+        """Test FAST_MOOD_DETECT gives the same mood as the keyword loops."""
+        pytest.importorskip("ahocorasick")
+
+        with patch("app.services.context.config.FAST_MOOD_DETECT", False):
+            expected = service.detect_mood(message)
+        with patch("app.services.context.config.FAST_MOOD_DETECT", True):
+            assert service.detect_mood(message) == expected
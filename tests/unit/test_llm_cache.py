@@ -0,0 +1,48 @@
+"""Unit tests for the Redis reply cache."""
+
+from unittest.mock import patch
+
+from app import llm_cache
+
+
+class TestLLMCache:
+    """Test reply caching helpers."""
+
+    def test_make_key_normalises_prompt(self):
+        """Test keys ignore case and surrounding whitespace."""
+        key = llm_cache.make_key("companion", "Ana", "s1", "  I have a Migraine ")
+
+        assert key == llm_cache.make_key("companion", "Ana", "s1", "i have a migraine")
+        assert key.startswith(llm_cache.KEY_PREFIX)
+
+    def test_make_key_separates_mode_user_and_session(self):
+        """Test the same prompt is cached per mode, per user and per session."""
+        base = llm_cache.make_key("companion", "Ana", "s1", "tell me more")
+
+        assert base != llm_cache.make_key("researcher", "Ana", "s1", "tell me more")
+        assert base != llm_cache.make_key("companion", "Ben", "s1", "tell me more")
+        assert base != llm_cache.make_key("companion", "Ana", "s2", "tell me more")
+
+    @patch("app.llm_cache.get_redis_client")
+    def test_get_decodes_hit(self, mock_client):
+        """Test cached bytes are returned as text."""
+        mock_client.return_value.get.return_value = "Rest 🌸".encode()
+
+        assert llm_cache.get("k") == "Rest 🌸"
+
+    @patch("app.llm_cache.get_redis_client")
+    def test_redis_errors_are_misses(self, mock_client):
+        """Test an unreachable Redis never breaks the conversation."""
+        mock_client.return_value.get.side_effect = ConnectionError("down")
+        mock_client.return_value.set.side_effect = ConnectionError("down")
+
+        assert llm_cache.get("k") is None
+        llm_cache.set("k", "v")
+
+    @patch("app.llm_cache.get_redis_client")
+    def test_set_uses_configured_ttl(self, mock_client):
+        """Test replies expire after LLM_CACHE_TTL by default."""
+        with patch("app.llm_cache.config.LLM_CACHE_TTL", 60):
+            llm_cache.set("k", "v")
+
+        mock_client.return_value.set.assert_called_once_with("k", "v", ex=60)
@@ -2,13 +2,14 @@
 
 import logging
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 from contextlib import contextmanager
 
 from app.logger import (
     get_logger,
     log_function_calls,
     suppress_verbose_logging,
+    quiet_loggers,
     PerformanceLogger,
     log_memory_usage
 )
@@ -43,6 +44,15 @@ class TestLogger:
         assert "%(name)s" in formatter._fmt
         assert "%(message)s" in formatter._fmt
 
+    @patch("app.logger._QUIET", True)
+    def test_get_logger_quiet_mode_returns_noop(self):
+        """Test quiet mode hands out a logger that never emits."""
+        logger = get_logger("test.quiet")
+
+        assert not isinstance(logger, logging.Logger)
+        assert logger.isEnabledFor(logging.CRITICAL) is False
+        assert logger.error("ignored %s", "message") is None
+
 
 class TestLogFunctionCalls:
     """Test function call logging decorator."""
@@ -58,8 +68,8 @@ class TestLogFunctionCalls:
         result = test_function()
 
         assert result == "result"
-        mock_logger.debug.assert_any_call("Entering test_function")
-        mock_logger.debug.assert_any_call("Exiting test_function successfully")
+        mock_logger.debug.assert_any_call("Entering %s", "test_function")
+        mock_logger.debug.assert_any_call("Exiting %s successfully", "test_function")
 
     def test_log_function_calls_decorator_with_exception(self):
         """Test the log_function_calls decorator with exceptions."""
@@ -72,13 +82,46 @@ class TestLogFunctionCalls:
         with pytest.raises(ValueError, match="test error"):
             test_function()
 
-        mock_logger.debug.assert_any_call("Entering test_function")
+        mock_logger.debug.assert_any_call("Entering %s", "test_function")
         mock_logger.error.assert_called_once()
 
+    def test_log_function_calls_errors_only_when_debug_disabled(self):
+        """Test the decorator skips entry/exit logging below DEBUG."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.side_effect = lambda level: level >= logging.WARNING
+
+        @log_function_calls(mock_logger)
+        def test_function():
+            raise ValueError("test error")
+
+        with pytest.raises(ValueError, match="test error"):
+            test_function()
+
+        mock_logger.debug.assert_not_called()
+        mock_logger.error.assert_called_once_with(
+            "Exception in %s: %s", "test_function", ANY, exc_info=True
+        )
+
+    def test_log_function_calls_returns_function_when_silent(self):
+        """Test the decorator is a no-op when errors would not be logged."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
+        def test_function():
+            return "result"
+
+        assert log_function_calls(mock_logger)(test_function) is test_function
+
 
 class TestSuppressVerboseLogging:
     """Test verbose logging suppression."""
 
+    @pytest.fixture(autouse=True)
+    def reset_suppression_state(self):
+        """Run each test against a fresh, unsuppressed module state."""
+        with patch("app.logger._SUPPRESSED", False), patch("app.logger._SEEN_LOGGERS", set()):
+            yield
+
     @patch('logging.getLogger')
     def test_suppress_verbose_logging(self, mock_get_logger):
         """Test suppress_verbose_logging sets correct log levels."""
@@ -106,8 +149,22 @@ class TestSuppressVerboseLogging:
         for call in expected_calls:
             mock_get_logger.assert_any_call(call)
 
-        # Check that setLevel was called with appropriate levels
-        assert mock_logger_instance.setLevel.called
+        # Check that silenced loggers are muted outright
+        assert mock_logger_instance.level == logging.CRITICAL
+        assert mock_logger_instance.disabled is True
+        assert mock_logger_instance.propagate is False
+
+    @patch('logging.getLogger')
+    def test_suppress_verbose_logging_is_idempotent(self, mock_get_logger):
+        """Test repeated calls skip the explicit silencing pass."""
+        suppress_verbose_logging()
+        mock_get_logger.reset_mock()
+
+        suppress_verbose_logging()
+
+        called = [c.args[0] for c in mock_get_logger.call_args_list]
+        assert "httpx" not in called
+        assert "agno.tools.function" not in called
 
     @patch('logging.getLogger')
     def test_suppress_verbose_logging_sets_root_level(self, mock_get_logger):
@@ -121,6 +178,18 @@ class TestSuppressVerboseLogging:
         mock_root_logger.setLevel.assert_called_once_with(logging.WARNING)
 
 
+class TestQuietLoggers:
+    """Test muting named loggers."""
+
+    def test_quiet_loggers_mutes_children(self):
+        """Test a muted logger swallows its children's records too."""
+        quiet_loggers(["migru.test_quiet"])
+        child = logging.getLogger("migru.test_quiet.child")
+
+        assert logging.getLogger("migru.test_quiet").propagate is False
+        assert not child.isEnabledFor(logging.ERROR)
+
+
 class TestPerformanceLogger:
     """Test performance logging context manager."""
 
@@ -133,8 +202,10 @@ class TestPerformanceLogger:
         with PerformanceLogger(mock_logger, "test_operation"):
             pass
 
-        mock_logger.debug.assert_called_with("Starting test_operation")
-        mock_logger.info.assert_called_with("test_operation completed in 0.00 seconds")
+        mock_logger.debug.assert_called_with("Starting %s", "test_operation")
+        mock_logger.info.assert_called_with(
+            "%s completed in %.2f seconds", "test_operation", ANY
+        )
 
     @patch('app.logger.PerformanceLogger')
     def test_performance_logger_with_exception(self, mock_performance_logger):
@@ -146,30 +217,51 @@ class TestPerformanceLogger:
             with PerformanceLogger(mock_logger, "test_operation"):
                 raise ValueError("test error")
 
-        mock_logger.error.assert_called_with("test_operation failed with ValueError: test error")
+        mock_logger.error.assert_called_with(
+            "%s failed with %s: %s", "test_operation", "ValueError", ANY
+        )
+
+    def test_performance_logger_skips_disabled_levels(self):
+        """Test PerformanceLogger doesn't log below the logger's level."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
+        with PerformanceLogger(mock_logger, "test_operation"):
+            pass
+
+        mock_logger.debug.assert_not_called()
+        mock_logger.info.assert_not_called()
+
 
 
 class TestLogMemoryUsage:
     """Test memory usage logging."""
 
-    @patch('psutil.Process')
+    @patch('app.logger._PROCESS')
     def test_log_memory_usage_with_psutil(self, mock_process):
         """Test log_memory_usage with psutil available."""
         mock_logger = Mock()
-        mock_process_instance = Mock()
-        mock_process.return_value = mock_process_instance
-        mock_process_instance.memory_info.return_value.rss = 1024 * 1024 * 50  # 50 MB
+        mock_process.memory_info.return_value.rss = 1024 * 1024 * 50  # 50 MB
 
         log_memory_usage(mock_logger)
 
-        mock_logger.debug.assert_called_with("Memory usage: 50.00 MB")
+        mock_logger.debug.assert_called_with("Memory usage: %.2f MB", 50.0)
 
-    @patch('builtins.__import__')
-    def test_log_memory_usage_without_psutil(self, mock_import):
+    @patch('app.logger._PROCESS', None)
+    def test_log_memory_usage_without_psutil(self):
         """Test log_memory_usage without psutil available."""
-        mock_import.side_effect = ImportError("No module named 'psutil'")
+        mock_logger = Mock()
+        log_memory_usage(mock_logger)
 
+        mock_logger.debug.assert_called_with("psutil not available, skipping memory logging")
+
+    @patch('app.logger._PROCESS')
+    def test_log_memory_usage_skipped_when_debug_disabled(self, mock_process):
+        """Test log_memory_usage doesn't read memory when DEBUG is off."""
         mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
         log_memory_usage(mock_logger)
 
-        mock_logger.debug.assert_called_with("psutil not available, skipping memory logging")
\ No newline at end of file
+        mock_process.memory_info.assert_not_called()
+        mock_logger.debug.assert_not_called()
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""Unit tests for the therapeutic CLI in app.main."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from rich.markdown import Markdown
+
+from app.main import TherapeuticCLI, _EXIT_RE, _breath_frame, _current_hour, _exit_matcher
+
+
+@pytest.fixture
+def cli():
+    """CLI instance with a mocked console."""
+    instance = TherapeuticCLI()
+    instance.console = Mock()
+    return instance
+
+
+class TestHandleCommand:
+    """Test slash command dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_exit_commands_end_session(self, cli):
+        """Test exit aliases return True."""
+        with patch.object(TherapeuticCLI, "_display_farewell") as farewell:
+            for cmd in ("/exit", "/quit", "/bye"):
+                assert await cli.handle_command(cmd) is True
+        assert farewell.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_display_command_skips_turn(self, cli):
+        """Test sync display commands return False."""
+        display_stats = Mock(return_value=None)
+        cli._exact_commands["/stats"] = display_stats
+
+        assert await cli.handle_command("  /STATS ") is False
+        display_stats.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_async_prefix_command_is_awaited(self, cli):
+        """Test async handlers receive the argument and are awaited."""
+        with patch.object(
+            TherapeuticCLI, "_handle_research", AsyncMock(return_value=False)
+        ) as handle_research:
+            assert await cli.handle_command("/research migraine triggers") is False
+        handle_research.assert_awaited_once_with("migraine triggers")
+
+    @pytest.mark.asyncio
+    async def test_model_is_not_dispatched_as_mode(self, cli):
+        """Test /model isn't taken for /mode, its prefix."""
+        with patch.object(TherapeuticCLI, "_switch_model") as switch_model, \
+                patch.object(TherapeuticCLI, "_switch_mode") as switch_mode:
+            await cli.handle_command("/model cerebras")
+
+        switch_model.assert_called_once_with("cerebras")
+        switch_mode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_commands_match_whole_first_word(self, cli):
+        """Test a word merely starting with a command name isn't dispatched."""
+        with patch.object(TherapeuticCLI, "_handle_med_gemma") as handle_med:
+            assert await cli.handle_command("/mediate calm") is None
+
+        handle_med.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_command_returns_none(self, cli):
+        """Test unknown commands fall through to the conversation."""
+        assert await cli.handle_command("/unknown") is None
+
+
+class TestDisplayResponse:
+    """Test response rendering."""
+
+    @patch("app.main.config.STREAM_MARKDOWN", False)
+    def test_streamed_reply_text_is_returned(self, cli, capsys):
+        """Test a streamed reply is written as it arrives and returned whole."""
+        def stream():
+            yield "Hello "
+            yield "world\n"
+
+        assert cli._display_response(stream()) == "Hello world\n"
+        assert capsys.readouterr().out == "Hello world\n"
+
+    @patch("app.main.config.STREAM_MARKDOWN", False)
+    def test_streamed_string_chunks_are_written(self, cli, capsys):
+        """Test plain string streams are written as-is."""
+        cli._display_response(chunk for chunk in ("a", "b"))
+
+        assert capsys.readouterr().out == "ab"
+
+    @patch("app.main.config.STREAM_MARKDOWN", True)
+    def test_streamed_markdown_renders_per_paragraph(self, cli):
+        """Test Markdown is rendered once per completed paragraph."""
+        chunks = ("# Tips\n", "\nRest in", " a dark room.\n\n", "```\na\n\nb\n```")
+
+        cli._display_response(chunk for chunk in chunks)
+
+        rendered = [
+            call.args[0].markup
+            for call in cli.console.print.call_args_list
+            if call.args and isinstance(call.args[0], Markdown)
+        ]
+        assert rendered == ["# Tips", "Rest in a dark room.", "```\na\n\nb\n```"]
+
+
+class TestStaticScreens:
+    """Test cached rendering of static screens."""
+
+    def test_static_screen_is_rendered_once(self, cli):
+        """Test repeated prints reuse the first rendering at a given width."""
+        build = Mock(return_value="Rest in a dark room.")
+        cli.console.width = 80
+
+        cli._print_static(build)
+        cli._print_static(build)
+
+        build.assert_called_once()
+        assert cli.console.file.write.call_args.args[0] == "Rest in a dark room.\n"
+
+
+class TestSessionStats:
+    """Test session statistics helpers."""
+
+    def test_elapsed_splits_minutes_and_seconds(self, cli):
+        """Test _elapsed returns whole minutes and leftover seconds."""
+        from datetime import datetime, timedelta
+
+        cli.session_start = datetime.now() - timedelta(minutes=2, seconds=5)
+
+        assert cli._elapsed() == (2, 5)
+
+    def test_stats_do_not_load_core(self, cli):
+        """Test /stats reports an unloaded core instead of importing it."""
+        cli._display_stats()
+
+        assert cli._migru_core is None
+        cli.console.print.assert_called_once()
+
+
+class TestPatternEvents:
+    """Test background recording of pattern events."""
+
+    @pytest.fixture
+    def draining_cli(self, cli):
+        """CLI with a mocked pattern detector and a running event drainer."""
+        import queue
+        import threading
+
+        cli._pattern = Mock()
+        cli._event_q = queue.Queue()
+        threading.Thread(target=cli._drain_events, daemon=True).start()
+        return cli
+
+    def test_events_are_written_in_batches(self, draining_cli):
+        """Test events reach storage together once a batch fills up."""
+        from app.main import _EVENT_BATCH_SIZE
+
+        for i in range(_EVENT_BATCH_SIZE):
+            draining_cli._event_q.put_nowait({"user_id": "Ana", "content": str(i)})
+        draining_cli._event_q.join()
+
+        draining_cli._pattern.record_events.assert_called_once()
+        assert len(draining_cli._pattern.record_events.call_args.args[0]) == _EVENT_BATCH_SIZE
+
+    def test_flush_writes_partial_batch(self, draining_cli):
+        """Test flushing stores buffered events and survives a failed write."""
+        draining_cli._pattern.record_events.side_effect = [RuntimeError("db down"), None]
+
+        draining_cli._event_q.put_nowait({"user_id": "Ana"})
+        draining_cli._flush_events()
+        draining_cli._event_q.put_nowait({"user_id": "Ana"})
+        draining_cli._flush_events()
+
+        assert draining_cli._pattern.record_events.call_count == 2
+
+    def test_current_hour_is_cached(self):
+        """Test the clock is consulted once per minute, not per message."""
+        with patch("app.main._hour_cache", [0.0, -1]), \
+             patch("app.main.time.localtime") as mock_localtime:
+            mock_localtime.return_value.tm_hour = 14
+
+            assert _current_hour() == 14
+            assert _current_hour() == 14
+
+        mock_localtime.assert_called_once()
+
+
+
+class TestBreathing:
+    """Test the breathing exercise timeline."""
+
+    def test_frame_tracks_phase_and_second(self):
+        """Test frames advance one mark per second within each phase."""
+        assert _breath_frame(0, 0.2, 3).endswith("(4 seconds)[/dim]\n  ●")
+        assert _breath_frame(0, 3.9, 3).endswith("  ●●●●")
+        assert "Hold gently" in _breath_frame(0, 4.0, 3)
+        assert _breath_frame(1, 18.5, 3).startswith("[bold cyan]Cycle 2/3")
+
+    def test_pause_between_cycles_has_no_frame(self):
+        """Test the gap after a full 4-7-8 cycle renders nothing new."""
+        assert _breath_frame(0, 19.5, 3) is None
+
+
+class TestExitPhrases:
+    """Test exit phrase detection."""
+
+    @pytest.mark.parametrize("message", ["Bye!", "ok goodbye", "I gotta go now", "See you tomorrow"])
+    def test_exit_phrases_match(self, message):
+        """Test farewell phrases end the session."""
+        assert _EXIT_RE.search(message)
+
+    @pytest.mark.parametrize("message", ["maybe later", "bystander effect", "I have to gossip"])
+    def test_exit_phrases_need_whole_words(self, message):
+        """Test substrings inside other words don't end the session."""
+        assert _EXIT_RE.search(message) is None
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [("Bye!", True), ("See you tomorrow", True), ("bystander effect", False), ("I have to gossip", False)],
+    )
+    def test_hyperscan_matcher_agrees_with_regex(self, message, expected):
+        """Test the Hyperscan matcher finds the same exit phrases."""
+        pytest.importorskip("hyperscan")
+        _exit_matcher.cache_clear()
+
+        assert _exit_matcher()(message) is expected
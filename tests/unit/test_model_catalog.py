@@ -0,0 +1,116 @@
+"""Unit tests for the /model catalog cache."""
+
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.cli import model_catalog
+
+
+@pytest.fixture
+def seed_path(tmp_path):
+    """Point the packaged seed catalog at a temporary file."""
+    path = tmp_path / "seed.json"
+    path.write_text(json.dumps({
+        "fetched_at": 0,
+        "entries": [
+            {"name": "mistral-small", "provider": "Mistral AI", "speed": "⚡", "intelligence": "🧠", "available": None},
+            {"name": "cerebras", "provider": "Cerebras", "speed": "⚡", "intelligence": "🧠", "available": None},
+        ],
+    }))
+    with patch.object(model_catalog, "SEED_CATALOG_PATH", path):
+        model_catalog._read_catalog.cache_clear()
+        yield path
+    model_catalog._read_catalog.cache_clear()
+
+
+@pytest.fixture
+def catalog_path(tmp_path, seed_path):
+    """Point the user's catalog copy at a not-yet-created file."""
+    path = tmp_path / "user-cache" / "migru" / "models.json"
+    with patch.object(model_catalog, "CATALOG_PATH", path):
+        yield path
+
+
+@pytest.fixture
+def online():
+    """Run in a privacy mode that may reach the providers."""
+    with patch.object(model_catalog.config, "PRIVACY_MODE", "hybrid"):
+        yield
+
+
+class TestModelCatalog:
+    """Test stale-while-revalidate catalog behaviour."""
+
+    def test_load_catalog_falls_back_to_seed(self, catalog_path):
+        """Test the packaged seed is served as tuples until a refresh."""
+        fetched_at, entries = model_catalog.load_catalog()
+
+        assert fetched_at == 0
+        assert entries[0] == ("mistral-small", "Mistral AI", "⚡", "🧠", None)
+
+    def test_missing_catalog_is_empty(self, tmp_path):
+        """Test missing files yield an empty, stale catalog."""
+        with patch.object(model_catalog, "CATALOG_PATH", tmp_path / "missing.json"), \
+             patch.object(model_catalog, "SEED_CATALOG_PATH", tmp_path / "no-seed.json"):
+            assert model_catalog.load_catalog() == (0.0, ())
+
+    def test_is_stale(self):
+        """Test staleness is judged against the TTL."""
+        assert model_catalog.is_stale(0)
+        assert not model_catalog.is_stale(time.time())
+
+    @pytest.mark.asyncio
+    async def test_refresh_marks_availability(self, catalog_path, seed_path, online):
+        """Test refresh writes availability to the user's copy, not the seed."""
+        seed = seed_path.read_text()
+        served = {"mistral": {"mistral-small-latest"}}
+        resolve = {"mistral-small": "mistral:mistral-small-latest", "cerebras": "cerebras:llama3.1-8b"}.get
+
+        with patch.object(model_catalog, "_fetch_served_models", AsyncMock(return_value=served)):
+            assert await model_catalog.refresh_catalog(resolve) is True
+
+        fetched_at, entries = model_catalog.load_catalog()
+        assert not model_catalog.is_stale(fetched_at)
+        # Cerebras wasn't checked, so its availability stays unknown
+        assert [e[4] for e in entries] == [True, None]
+        assert catalog_path.exists()
+        assert seed_path.read_text() == seed
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_catalog(self, catalog_path, online):
+        """Test an offline refresh writes nothing."""
+        with patch.object(model_catalog, "_fetch_served_models", AsyncMock(return_value={})):
+            assert await model_catalog.refresh_catalog(lambda name: None) is False
+
+        assert not catalog_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_local_mode_never_fetches(self, catalog_path):
+        """Test local privacy mode makes no provider calls."""
+        fetch = AsyncMock(return_value={"mistral": {"mistral-small-latest"}})
+
+        with patch.object(model_catalog.config, "PRIVACY_MODE", "local"), \
+             patch.object(model_catalog, "_fetch_served_models", fetch):
+            assert not model_catalog.refresh_allowed()
+            assert await model_catalog.refresh_catalog(lambda name: None) is False
+
+        fetch.assert_not_awaited()
+        assert not catalog_path.exists()
+
+    def test_new_seed_entries_show_through_cached_copy(self, catalog_path, seed_path):
+        """Test models added to the seed appear alongside cached availability."""
+        model_catalog._write_catalog(123.0, [("mistral-small", "Mistral AI", "⚡", "🧠", True)])
+        seed = json.loads(seed_path.read_text())
+        seed["entries"].append(
+            {"name": "new-model", "provider": "Mistral AI", "speed": "⚡", "intelligence": "🧠", "available": None}
+        )
+        seed_path.write_text(json.dumps(seed))
+
+        fetched_at, entries = model_catalog.load_catalog()
+
+        assert fetched_at == 123.0
+        assert [(e[0], e[4]) for e in entries] == [
+            ("mistral-small", True), ("cerebras", None), ("new-model", None)
+        ]
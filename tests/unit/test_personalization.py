@@ -0,0 +1,64 @@
+"""Unit tests for user profile caching."""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from app.personalization import PersonalizationEngine
+
+
+@pytest.fixture
+def redis_client():
+    """Mocked shared Redis client holding one stored profile."""
+    client = Mock()
+    client.get.return_value = json.dumps({"basics": {"name": "Ana"}})
+    with patch("app.db.get_redis_client", return_value=client):
+        yield client
+
+
+class TestUserProfileCache:
+    """Test profile reads are reused within the TTL."""
+
+    def test_profile_is_read_once_per_user(self, redis_client):
+        """Test repeated lookups share one instance and one Redis read."""
+        engine = PersonalizationEngine(db=Mock())
+
+        first = engine.get_user_profile("Ana").get_profile()
+        first["basics"]["name"] = "changed"
+        second = engine.get_user_profile("Ana").get_profile()
+
+        assert second == {"basics": {"name": "Ana"}}
+        redis_client.get.assert_called_once()
+
+    def test_update_refreshes_cache(self, redis_client):
+        """Test a write is visible to the next read without a round-trip."""
+        profile = PersonalizationEngine(db=Mock()).get_user_profile("Ana")
+
+        profile.update_profile({"metadata": {"onboarding_completed": True}})
+
+        assert profile.get_profile()["metadata"] == {"onboarding_completed": True}
+        redis_client.get.assert_called_once()
+
+    def test_expired_profile_is_reread(self, redis_client):
+        """Test the cached profile is dropped after PROFILE_CACHE_TTL."""
+        profile = PersonalizationEngine(db=Mock()).get_user_profile("Ana")
+
+        profile.get_profile()
+        with patch("app.personalization.PROFILE_CACHE_TTL", -1):
+            profile.get_profile()
+
+        assert redis_client.get.call_count == 2
+
+    def test_update_merges_nested_sections(self, redis_client):
+        """Test a partial section update keeps the section's other fields."""
+        redis_client.get.return_value = json.dumps(
+            {"metadata": {"total_conversations": 3, "onboarding_completed": False}}
+        )
+        profile = PersonalizationEngine(db=Mock()).get_user_profile("Ana")
+
+        profile.update_profile({"metadata": {"onboarding_completed": True}})
+
+        assert profile.get_profile()["metadata"] == {
+            "total_conversations": 3,
+            "onboarding_completed": True,
+        }
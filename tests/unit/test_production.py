@@ -0,0 +1,43 @@
+"""Unit tests for production health checks."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app import production
+from app.production import HealthCheck
+
+
+@pytest.fixture(autouse=True)
+def fresh_health_cache():
+    """Start every test with no cached Redis health."""
+    production._redis_health = (float("-inf"), {})
+    yield
+    production._redis_health = (float("-inf"), {})
+
+
+class TestRedisHealth:
+    """Test the Redis health check reuses the shared client."""
+
+    @patch("app.db.get_redis_client")
+    def test_result_is_cached_briefly(self, mock_client):
+        """Test repeated checks within the TTL don't ping Redis again."""
+        mock_client.return_value.info.return_value = {"used_memory": 1024 * 1024}
+
+        first = HealthCheck.check_redis()
+        second = HealthCheck.check_redis()
+
+        assert first == second
+        assert first["connected"] is True
+        mock_client.return_value.ping.assert_called_once()
+
+    @patch("app.db.get_redis_client")
+    def test_expired_result_is_rechecked(self, mock_client):
+        """Test a stale result triggers a fresh ping."""
+        mock_client.return_value.ping.side_effect = ConnectionError("down")
+
+        assert HealthCheck.check_redis()["connected"] is False
+        with patch.object(production, "REDIS_HEALTH_TTL", -1.0):
+            HealthCheck.check_redis()
+
+        assert mock_client.return_value.ping.call_count == 2
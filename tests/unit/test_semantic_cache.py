@@ -0,0 +1,82 @@
+"""Unit tests for the semantic reply cache."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app import semantic_cache
+
+
+@pytest.fixture
+def enabled():
+    """Enable the cache with a fake index and embedding."""
+    with patch("app.semantic_cache.config.SEMANTIC_CACHE_ENABLED", True), \
+            patch("app.semantic_cache._ensure_index", return_value=True), \
+            patch("app.semantic_cache._embed", return_value=b"vec"), \
+            patch("app.semantic_cache.get_redis_client") as mock_client:
+        yield mock_client.return_value
+
+
+class TestSemanticCache:
+    """Test paraphrase lookups and eligibility."""
+
+    @pytest.mark.parametrize("prompt", ["/help me with this", "my head hurts"])
+    def test_commands_and_short_inputs_are_ineligible(self, prompt):
+        """Test commands and inputs under MIN_WORDS words are skipped."""
+        assert not semantic_cache.is_eligible(prompt)
+
+    def test_disabled_cache_never_queries(self):
+        """Test nothing is looked up when the cache is off."""
+        with patch("app.semantic_cache.config.SEMANTIC_CACHE_ENABLED", False), \
+                patch("app.semantic_cache._ensure_index") as ensure_index:
+            assert semantic_cache.lookup("ana", "companion", "s1", "I have a pounding headache today") is None
+        ensure_index.assert_not_called()
+
+    def test_close_match_returns_reply(self, enabled):
+        """Test a neighbour above the similarity threshold is reused."""
+        doc = SimpleNamespace(distance=b"0.05", reply="Try resting in a dark room".encode())
+        enabled.ft.return_value.search.return_value = SimpleNamespace(docs=[doc])
+
+        assert semantic_cache.lookup("ana", "companion", "s1", "my head is really hurting today") == "Try resting in a dark room"
+
+    def test_distant_match_is_a_miss(self, enabled):
+        """Test a neighbour below the similarity threshold is ignored."""
+        doc = SimpleNamespace(distance="0.3", reply="unrelated")
+        enabled.ft.return_value.search.return_value = SimpleNamespace(docs=[doc])
+
+        assert semantic_cache.lookup("ana", "companion", "s1", "what should I eat for dinner") is None
+
+    def test_store_sets_ttl(self, enabled):
+        """Test stored replies expire after SEMANTIC_CACHE_TTL."""
+        pipeline = enabled.pipeline.return_value
+
+        semantic_cache.store("ana", "companion", "s1", "I have a pounding headache today", "Rest")
+
+        pipeline.expire.assert_called_once()
+        assert pipeline.expire.call_args.args[1] == semantic_cache.SEMANTIC_CACHE_TTL
+        pipeline.execute.assert_called_once()
+
+    def test_reply_is_scoped_to_mode_and_session(self, enabled):
+        """Test a stored reply only comes back for the same mode and session."""
+        stored = {}
+        enabled.pipeline.return_value.hset.side_effect = lambda key, mapping: stored.update(mapping)
+
+        def search(query, query_params):
+            # Honour the tag filters the way RediSearch would
+            text = query.query_string()
+            match = all(
+                f"@{field}:{{{semantic_cache._tag(stored[field])}}}" in text
+                for field in ("user", "mode", "session")
+            )
+            docs = [SimpleNamespace(distance="0", reply=stored["reply"])] if match else []
+            return SimpleNamespace(docs=docs)
+
+        enabled.ft.return_value.search.side_effect = search
+        prompt = "I have a pounding headache today"
+
+        semantic_cache.store("ana", "companion", "s1", prompt, "Rest")
+
+        assert semantic_cache.lookup("ana", "companion", "s1", prompt) == "Rest"
+        assert semantic_cache.lookup("ana", "researcher", "s1", prompt) is None
+        assert semantic_cache.lookup("ana", "companion", "s2", prompt) is None
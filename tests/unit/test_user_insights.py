@@ -0,0 +1,26 @@
+"""Unit tests for conversational insight extraction."""
+
+from app.services.user_insights import InsightExtractor
+
+
+class TestSensitivities:
+    """Test the single-pass sensitivity scan."""
+
+    def setup_method(self):
+        self.extract = InsightExtractor.__new__(InsightExtractor)._extract_sensitivities
+
+    def test_detects_each_sensitivity(self):
+        """Test phrases from every group are picked up in one message."""
+        result = self.extract("Barometric shifts and SUN GLARE get me, loud rooms too")
+
+        assert result == {"weather_sensitive": True, "light_sensitive": True, "noise_sensitive": True}
+
+    def test_stress_triggers_keep_their_order(self):
+        """Test triggers are listed in a stable order, once each."""
+        result = self.extract("Conflict at work, crowded trains and a deadline, more conflict")
+
+        assert result == {"stress_triggers": ["deadlines", "crowds", "conflict"]}
+
+    def test_no_match_is_none(self):
+        """Test a neutral message yields nothing."""
+        assert self.extract("Had a calm day today") is None
@@ -0,0 +1,23 @@
+"""Unit tests for performance utilities."""
+
+from app.utils import PerformanceMonitor, _NoopMonitor
+
+
+class TestPerformanceMonitor:
+    """Test operation timers."""
+
+    def test_timer_records_duration(self):
+        """Test a started and ended timer is recorded."""
+        monitor = PerformanceMonitor()
+
+        monitor.start_timer("startup")
+        assert monitor.end_timer("startup") is not None
+        assert len(monitor.metrics["startup"]) == 1
+
+    def test_noop_monitor_records_nothing(self):
+        """Test timers are no-ops when profiling is off."""
+        monitor = _NoopMonitor()
+
+        monitor.start_timer("startup")
+        assert monitor.end_timer("startup") is None
+        assert monitor.get_report() == "No performance metrics available."